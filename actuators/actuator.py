@@ -1,10 +1,10 @@
 import logging
-import threading
-import time
-from typing import Optional, Any
+from typing import Optional, Any, Dict
 import RPi.GPIO as GPIO
 import datetime
+from actuators.state_reporter import ActuatorStateReporter
 from databases.influx import InfluxDBManager
+from gpio_manager import GPIOManager
 
 class BaseActuator:
     """
@@ -16,6 +16,9 @@ class BaseActuator:
         state (bool): The current state of the actuator (True for active, False for inactive).
         last_state_change_time (datetime.datetime): Timestamp of the last state change.
         previous_state (bool): The state of the actuator prior to the current state.
+        state_tags (Dict[str, str]): InfluxDB tags identifying the actuator, built once and shared by every state write.
+        closed (bool): Whether the actuator has been closed and its GPIO pin released.
+        influx_manager (InfluxDBManager): Shared InfluxDB manager used to record state changes.
     """
 
     def __init__(self, gpio_pin: int, name: str, initial_state: Optional[bool] = None, send_state_to_db: bool = False) -> None:
@@ -29,16 +32,16 @@ class BaseActuator:
         self.logger = logging.getLogger('app_logger')
         self.gpio_pin = gpio_pin
         self.name = name
+        self.state_tags: Dict[str, str] = {"actuator_name": name, "gpio_pin": str(gpio_pin)}
         self.state = False
         self.last_state_change_time = None
         self.previous_state = None
         self.send_state_to_db = send_state_to_db
-        self.state_send_thread = None
-        self.state_send_thread_running = False
-        GPIO.setwarnings(False)
-        GPIO.setmode(GPIO.BCM)
-        GPIO.cleanup(self.gpio_pin)
-        GPIO.setup(self.gpio_pin, GPIO.OUT)
+        self.closed = False
+        self.influx_manager: InfluxDBManager = InfluxDBManager()
+        GPIOManager.ensure_mode()
+        GPIO.setup(self.gpio_pin, GPIO.OUT, initial=GPIO.LOW if initial_state else GPIO.HIGH)
+        GPIOManager.claim(self.gpio_pin)
 
         if initial_state is not None:
             try:
@@ -48,7 +51,7 @@ class BaseActuator:
                 else:
                     self.deactivate()
             except Exception as ex:
-                self.logger.error(f"Error setting initial state of actuator name={self.name} on pin {self.gpio_pin}: {ex}")
+                self.logger.error("Error setting initial state of actuator name=%s on pin %s: %s", self.name, self.gpio_pin, ex)
 
         if self.send_state_to_db:
             self.start_sending_state()
@@ -66,51 +69,45 @@ class BaseActuator:
                 self.previous_state = self.state
             self.state = new_state
             self.last_state_change_time = datetime.datetime.now()
-            self.logger.info(f"State of actuator name={self.name} {self.gpio_pin} changed to {self.state}.")
+            self.logger.info("State of actuator name=%s %s changed to %s.", self.name, self.gpio_pin, self.state)
         except Exception as ex:
-            self.logger.error(f"Error updating state of actuator name={self.name} on pin {self.gpio_pin}: {ex}")
+            self.logger.error("Error updating state of actuator name=%s on pin %s: %s", self.name, self.gpio_pin, ex)
 
-    def _send_state_to_db(self, frequency: int = 300):
+    def get_state_point(self) -> Dict[str, Any]:
         """
-        Continuously sends the current state to the database at a specified frequency.
+        Builds an InfluxDB data point describing the current state of the actuator.
 
-        Args:
-            frequency (int): The frequency, in seconds, at which the state is sent to the database. Defaults to 300 seconds (5 minutes).
+        Returns:
+            Dict[str, Any]: The data point with the measurement name, tags and the current state.
         """
-        while self.state_send_thread_running:
-            influx_manager = InfluxDBManager()
-            influx_manager.write_data(
-                measurement="actuator_events",
-                fields={"state": int(self.state)},
-                tags={"actuator_name": self.name, "gpio_pin": str(self.gpio_pin)}
-            )
-            time.sleep(frequency)
+        return {
+            "measurement": "actuator_events",
+            "tags": self.state_tags,
+            "fields": {"state": int(self.state)}
+        }
 
     def start_sending_state(self):
         """
-        Starts a new thread to continuously send the state to the database.
+        Registers the actuator with the shared state reporter, which periodically sends the state to the database.
         """
-        if not self.state_send_thread_running:
-            self.state_send_thread_running = True
-            self.state_send_thread = threading.Thread(target=self._send_state_to_db, daemon=True)
-            self.state_send_thread.start()
+        ActuatorStateReporter().register(self)
 
     def stop_sending_state(self):
         """
-        Stops the state sending thread if it is currently running.
+        Unregisters the actuator from the shared state reporter if its state is currently being sent.
         """
-        if self.state_send_thread_running:
-            self.state_send_thread_running = False
-            self.state_send_thread.join()
+        reporter = ActuatorStateReporter()
+        if reporter.is_registered(self):
+            reporter.unregister(self)
 
     def is_sending_state(self) -> bool:
         """
-        Checks whether the state sending thread is currently running.
+        Checks whether the state of the actuator is currently being sent to the database.
 
         Returns:
-            bool: True if the state sending thread is running, False otherwise.
+            bool: True if the actuator is registered with the state reporter, False otherwise.
         """
-        return self.state_send_thread_running
+        return ActuatorStateReporter().is_registered(self)
 
     def activate(self) -> None:
         """
@@ -119,18 +116,17 @@ class BaseActuator:
         Raises:
             Exception: If there is an error in setting the GPIO pin.
         """
-        influx_manager = InfluxDBManager()
         try:
             GPIO.output(self.gpio_pin, GPIO.LOW)
             self._update_state(True)
-            self.logger.info(f"Actuator name={self.name} on pin: {self.gpio_pin} has been activated - set {GPIO.LOW}.")
-            influx_manager.write_data(
+            self.logger.info("Actuator name=%s on pin: %s has been activated - set %s.", self.name, self.gpio_pin, GPIO.LOW)
+            self.influx_manager.write_data(
                 measurement="actuator_events",
                 fields={"state": 1},
-                tags={"actuator_name": self.name, "gpio_pin": str(self.gpio_pin)}
+                tags=self.state_tags
             )
         except Exception as ex:
-            self.logger.error(f"Failed to activate actuator name={self.name} on pin {self.gpio_pin}: {ex}")
+            self.logger.error("Failed to activate actuator name=%s on pin %s: %s", self.name, self.gpio_pin, ex)
             raise
 
     def deactivate(self) -> None:
@@ -140,18 +136,17 @@ class BaseActuator:
         Raises:
             Exception: If there is an error in setting the GPIO pin.
         """
-        influx_manager = InfluxDBManager()
         try:
             GPIO.output(self.gpio_pin, GPIO.HIGH)
             self._update_state(False)
-            self.logger.info(f"Actuator name={self.name} on pin: {self.gpio_pin} has been deactivated - set {GPIO.HIGH}.")
-            influx_manager.write_data(
+            self.logger.info("Actuator name=%s on pin: %s has been deactivated - set %s.", self.name, self.gpio_pin, GPIO.HIGH)
+            self.influx_manager.write_data(
                 measurement="actuator_events",
                 fields={"state": 0},
-                tags={"actuator_name": self.name, "gpio_pin": str(self.gpio_pin)}
+                tags=self.state_tags
             )
         except Exception as ex:
-            self.logger.error(f"Failed to deactivate actuator name={self.name} on pin {self.gpio_pin}: {ex}")
+            self.logger.error("Failed to deactivate actuator name=%s on pin %s: %s", self.name, self.gpio_pin, ex)
             raise
 
     def toggle(self) -> None:
@@ -163,9 +158,9 @@ class BaseActuator:
                 self.deactivate()
             else:
                 self.activate()
-            self.logger.info(f"Actuator {self.gpio_pin} state toggled.")
+            self.logger.info("Actuator %s state toggled.", self.gpio_pin)
         except Exception as ex:
-            self.logger.error(f"Error toggling actuator name={self.name} on pin {self.gpio_pin}: {ex}")
+            self.logger.error("Error toggling actuator name=%s on pin %s: %s", self.name, self.gpio_pin, ex)
             raise
 
     def get_state(self) -> bool:
@@ -213,14 +208,38 @@ class BaseActuator:
         """
         return self.name
 
-    def __del__(self) -> None:
+    def close(self) -> None:
         """
-        Destructor for the BaseActuator class. Cancels any ongoing activation and cleans up the GPIO pin.
+        Stops sending the state to the database and cleans up the GPIO pin. Calling it more than once has no effect.
+
+        Raises:
+            Exception: If there is an error in cleaning up the GPIO pin.
         """
+        if self.closed:
+            return
+        self.closed = True
         try:
             self.stop_sending_state()
             GPIO.cleanup(self.gpio_pin) # TODO: clearing will change the setting to the default - such as IN mode, which may be unwanted
-            self.logger.info(f"Actuator name={self.name} on pin: {self.gpio_pin} has been cleaned up.")
+            GPIOManager.release(self.gpio_pin)
+            self.logger.info("Actuator name=%s on pin: %s has been cleaned up.", self.name, self.gpio_pin)
         except Exception as ex:
-            self.logger.error(f"Error during cleanup of actuator name={self.name} on pin {self.gpio_pin}: {ex}")
+            self.logger.error("Error during cleanup of actuator name=%s on pin %s: %s", self.name, self.gpio_pin, ex)
             raise
+
+    def __enter__(self) -> 'BaseActuator':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        """
+        Destructor for the BaseActuator class. Falls back to close() if the actuator was not closed explicitly, without raising during interpreter shutdown.
+        """
+        if getattr(self, 'closed', True):
+            return
+        try:
+            self.close()
+        except Exception:
+            pass
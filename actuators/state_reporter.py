@@ -0,0 +1,115 @@
+import logging
+import threading
+import time
+from typing import Dict, Optional, TYPE_CHECKING
+from databases.influx import InfluxDBManager
+
+if TYPE_CHECKING:
+    from actuators.actuator import BaseActuator
+
+class ActuatorStateReporter:
+    """
+    Periodically sends the state of all registered actuators to InfluxDB in a single batched write.
+    Implements a singleton pattern so that all actuators share one reporting thread instead of running one thread each.
+
+    Attributes:
+        logger (logging.Logger): Logger instance for logging messages.
+        frequency (int): The frequency, in seconds, at which the states are sent to the database.
+        actuators (Dict[str, BaseActuator]): Registered actuators, keyed by actuator name.
+        thread (Optional[threading.Thread]): The reporting thread, None if not started.
+        stop_event (threading.Event): Event that wakes up and stops the current reporting thread.
+    """
+    _instance = None
+    _lock: threading.Lock = threading.Lock()
+
+    def __new__(cls, frequency: int = 300):
+        """
+        Ensures a single instance of the ActuatorStateReporter class is created.
+
+        Args:
+            frequency (int): The frequency, in seconds, at which the states are sent to the database. Only used when the instance is first created. Defaults to 300 seconds (5 minutes).
+
+        Returns:
+            ActuatorStateReporter: The singleton instance of the ActuatorStateReporter class.
+        """
+        with cls._lock:
+            if cls._instance is None:
+                instance = super(ActuatorStateReporter, cls).__new__(cls)
+                instance.logger = logging.getLogger('app_logger')
+                instance.frequency = frequency
+                instance.actuators = {}
+                instance.thread = None
+                instance.stop_event = threading.Event()
+                cls._instance = instance
+            return cls._instance
+
+    def register(self, actuator: 'BaseActuator') -> None:
+        """
+        Adds an actuator to the batch and starts the reporting thread if it is not running yet.
+
+        Args:
+            actuator (BaseActuator): The actuator whose state should be reported.
+        """
+        with self._lock:
+            self.actuators[actuator.get_name()] = actuator
+            if self.thread is None:
+                self.stop_event = threading.Event()
+                self.thread = threading.Thread(target=self._report_loop, args=(self.stop_event,), daemon=True)
+                self.thread.start()
+                self.logger.info("Actuator state reporting started.")
+
+    def unregister(self, actuator: 'BaseActuator') -> None:
+        """
+        Removes an actuator from the batch and stops the reporting thread once no actuators are left.
+
+        Args:
+            actuator (BaseActuator): The actuator to remove.
+        """
+        thread: Optional[threading.Thread] = None
+        with self._lock:
+            if self.actuators.get(actuator.get_name()) is actuator:
+                del self.actuators[actuator.get_name()]
+            if not self.actuators and self.thread is not None:
+                self.stop_event.set()
+                thread = self.thread
+                self.thread = None
+        if thread and thread is not threading.current_thread():
+            thread.join()
+            self.logger.info("Actuator state reporting stopped.")
+
+    def is_registered(self, actuator: 'BaseActuator') -> bool:
+        """
+        Checks whether the given actuator is currently reported.
+
+        Args:
+            actuator (BaseActuator): The actuator to check.
+
+        Returns:
+            bool: True if the actuator is registered, False otherwise.
+        """
+        return self.actuators.get(actuator.get_name()) is actuator
+
+    def _report_loop(self, stop_event: threading.Event) -> None:
+        """
+        Sends the states of all registered actuators in one write every `frequency` seconds until stopped.
+        Waits until an absolute monotonic deadline, so the time spent writing does not accumulate as drift. If a write overruns the period, the schedule restarts from the current time.
+
+        Args:
+            stop_event (threading.Event): Event set when this reporting thread should stop. The wait returns immediately once it is set.
+        """
+        influx_manager = InfluxDBManager()
+        next_deadline = time.monotonic()
+        while not stop_event.is_set():
+            with self._lock:
+                actuators = list(self.actuators.values())
+            points = [actuator.get_state_point() for actuator in actuators]
+            try:
+                influx_manager.write_points(points)
+            except Exception as ex:
+                self.logger.error(f"Error sending actuator states to database: {ex}")
+            next_deadline += self.frequency
+            now = time.monotonic()
+            if next_deadline < now:
+                next_deadline = now
+            if stop_event.wait(next_deadline - now):
+                break
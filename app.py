@@ -1,22 +1,66 @@
 import logging
 import os
-import time
-from typing import List, Optional, Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Type, Tuple
 from actuators.actuator import BaseActuator
 from app_config import LOG_DIR_PATH, AppConfig, APP_CONFIG_PATH
 from arduino.ArduinoManager import ArduinoManager
 from controllers.controller import BaseController
+from databases.influx import InfluxDBManager
 from controllers.irrigation_controller import IrrigationController
 from controllers.lighting_controller import LightingController
 from controllers.ventilation_controller import VentilationController
 from logger import LoggerManager
-from sensors.humidity_sensor import HumiditySensor
-from sensors.light_sensor import LightSensor
 from sensors.sensor import BaseSensor
-from sensors.soil_moisture_sensor import SoilMoistureSensor
-from sensors.temperature_sensor import TemperatureSensor
+import functools
+import importlib
 import uuid
 
+SENSOR_CLASSES: Dict[str, Tuple[str, str]] = {
+    'TemperatureSensor': ('sensors.temperature_sensor', 'TemperatureSensor'),
+    'HumiditySensor': ('sensors.humidity_sensor', 'HumiditySensor'),
+    'LightSensor': ('sensors.light_sensor', 'LightSensor'),
+    'SoilMoistureSensor': ('sensors.soil_moisture_sensor', 'SoilMoistureSensor'),
+}
+
+SENSOR_COMMON_PARAMS = frozenset({'name', 'read_frequency', 'max_readings', 'start_immediately', 'anomaly_detection', 'noise_floor', 'max_read_interval'})
+
+SENSOR_PARAMS: Dict[str, Dict[str, Any]] = {
+    'BaseSensor': {'required': ('name',), 'allowed': SENSOR_COMMON_PARAMS},
+    'TemperatureSensor': {'required': ('pin', 'name'), 'allowed': SENSOR_COMMON_PARAMS | {'pin', 'max_value', 'min_value', 'poll_interval'}},
+    'HumiditySensor': {'required': ('pin', 'name'), 'allowed': SENSOR_COMMON_PARAMS | {'pin', 'max_value', 'min_value', 'poll_interval'}},
+    'LightSensor': {'required': ('name',), 'allowed': SENSOR_COMMON_PARAMS | {'i2c_address', 'min_value', 'max_value'}},
+    'SoilMoistureSensor': {'required': ('name',), 'allowed': SENSOR_COMMON_PARAMS | {'i2c_address', 'channel', 'min_value', 'max_value'}},
+}
+
+ACTUATOR_REQUIRED_PARAMS = ('gpio_pin',)
+ACTUATOR_ALLOWED_PARAMS = frozenset(ACTUATOR_REQUIRED_PARAMS + ('initial_state',))
+
+CONTROLLER_CLASSES: Dict[str, Type[BaseController]] = {
+    'IrrigationController': IrrigationController,
+    'VentilationController': VentilationController,
+    'LightingController': LightingController,
+}
+
+@functools.lru_cache(maxsize=None)
+def load_sensor_class(sensor_type: str) -> Optional[Type[BaseSensor]]:
+    """
+    Imports the module of the given sensor type on first use and returns its class.
+    Sensor modules pull in their hardware driver libraries, so only the types referenced by the configuration are imported.
+
+    Args:
+        sensor_type (str): The sensor type name from the configuration.
+
+    Returns:
+        Optional[Type[BaseSensor]]: The sensor class, or None if the type is not known.
+    """
+    module_and_class = SENSOR_CLASSES.get(sensor_type)
+    if module_and_class is None:
+        return None
+    module_name, class_name = module_and_class
+    return getattr(importlib.import_module(module_name), class_name)
+
 class App:
     """
     A main application class responsible for initializing and managing the entire application lifecycle.
@@ -28,29 +72,35 @@ class App:
         sensors (Dict[BaseSensor]): Dict of sensor objects used in the application.
         actuators (Dict[BaseActuator]): Dict of actuator objects used in the application.
         controllers (Dict[BaseController]): Dict of controller objects that manage the application logic.
-        running (bool): Flag indicating if the application is currently running.
+        stop_event (threading.Event): Event set to signal the main application loop to stop.
+        stopped_event (threading.Event): Event set once the main application loop has stopped all components.
+        run_thread (Optional[threading.Thread]): The thread executing run_app, None if the application is not running.
     """
     def __init__(self) -> None:
         """
-        Initializes the application, sets up the directory structure, initializes logging, loads components based on the application configuration, and logs the initialization completion.
+        Initializes the application, sets up the directory structure, loads the configuration, initializes logging as set in its 'logging' section, loads components based on the application configuration, and logs the initialization completion.
         """
         self.setup_dir_structure([LOG_DIR_PATH])
-        LoggerManager.setup_logger('app_logger', os.path.join(LOG_DIR_PATH, 'app.log'), level_console=logging.INFO, level_file=logging.DEBUG)
-        self.logger: logging.Logger = logging.getLogger('app_logger')
         self.app_config: AppConfig = AppConfig(APP_CONFIG_PATH)
+        use_syslog = bool((self.app_config.get_config().get('logging') or {}).get('use_syslog', False))
+        LoggerManager.setup_logger('app_logger', os.path.join(LOG_DIR_PATH, 'app.log'), level_console=logging.INFO, level_file=logging.DEBUG, use_syslog=use_syslog)
+        self.logger: logging.Logger = logging.getLogger('app_logger')
         self.sensors: Dict[str, BaseSensor] = {}
         self.actuators: Dict[str, BaseActuator] = {}
         self.controllers: Dict[str, BaseController] = {}
+        self.stop_event: threading.Event = threading.Event()
+        self.stopped_event: threading.Event = threading.Event()
+        self.run_thread: Optional[threading.Thread] = None
         self.load_components()
         self.logger.info('Application initialized')
-        self.running: bool = False
 
     def reload_config(self) -> None:
         """
-        Reloads the application configuration from the configuration file and logs the outcome.
+        Reloads the application configuration from the configuration file and logs the outcome. The InfluxDB manager picks up the new 'influxdb' section on its next connection attempt.
         """
         try:
             self.app_config.load_config()
+            InfluxDBManager.reload_config()
             self.logger.info("Configuration reloaded successfully.")
         except Exception as ex:
             self.logger.error(f"Failed to reload configuration: {ex}")
@@ -59,23 +109,34 @@ class App:
         """
         Starts the application by beginning sensor readings, starting controllers, and entering the main application loop until a stop signal is received.
         """
-        self.running = True
+        self.stop_event.clear()
+        self.stopped_event.clear()
+        self.run_thread = threading.current_thread()
         self.start_sensors_reading()
         self.start_controllers()
         self.run_arduinoLCD()
         try:
-            while self.running:
-                time.sleep(0.5)
+            self.stop_event.wait()
         finally:
+            InfluxDBManager.shutdown()
             self.stop_sensors_reading()
             self.stop_controllers()
+            self.close_actuators()
+            self.run_thread = None
+            self.stopped_event.set()
 
-    def stop_app(self) -> None:
+    def stop_app(self, timeout: float = 10.0) -> None:
         """
-        Stops the application by signaling the main loop to terminate and waits for a short period to ensure all components are properly shutdown.
+        Stops the application by signaling the main loop to terminate. When called from another thread than the one running the application, waits until all components have been shut down, but no longer than the given timeout.
+
+        Args:
+            timeout (float): Maximum time in seconds to wait for the shutdown to complete. Defaults to 10 seconds.
         """
-        self.running = False
-        time.sleep(4)
+        self.stop_event.set()
+        run_thread = self.run_thread
+        if run_thread is not None and run_thread is not threading.current_thread():
+            if not self.stopped_event.wait(timeout):
+                self.logger.warning(f"Application did not stop within {timeout} seconds.")
 
     @staticmethod
     def setup_dir_structure(dir_list: List[str]) -> None:
@@ -99,59 +160,96 @@ class App:
         Args:
             dir_path (str): Path of the directory to be created.
         """
-        if not os.path.exists(dir_path):
-            os.makedirs(dir_path)
-            logging.info(f"Directory created: {dir_path}")
+        os.makedirs(dir_path, exist_ok=True)
 
     def start_controllers(self) -> None:
         """
         Initiates the start sequence for all configured controllers within the application.
         """
-        self.logger.debug(f"start_controllers - controllers len: {len(self.controllers)}.")
+        self.logger.debug("start_controllers - controllers len: %s.", len(self.controllers))
         for name, controller in self.controllers.items():
-            self.logger.debug(f"Try start controller by name: {name}.")
+            self.logger.debug("Try start controller by name: %s.", name)
+            controller_type = type(controller).__name__
             try:
-                if controller:
-                    controller.start()
-                    self.logger.info(f"{controller.__class__.__name__} started - name: {name}.")
+                controller.start()
+                self.logger.info(f"{controller_type} started - name: {name}.")
             except Exception as ex:
-                self.logger.error(f"Failed to start {controller.__class__.__name__} - name: {name}: {ex}")
+                self.logger.error(f"Failed to start {controller_type} - name: {name}: {ex}")
 
     def stop_controllers(self) -> None:
         """
         Initiates the stop sequence for all running controllers within the application.
+        The controllers are stopped concurrently, so waiting for one controller loop to finish does not delay stopping the others.
         """
-        for name, controller in self.controllers.items():
+        if not self.controllers:
+            return
+        with ThreadPoolExecutor(max_workers=len(self.controllers)) as executor:
+            for name, controller in self.controllers.items():
+                executor.submit(self.stop_controller, name, controller)
+
+    def stop_controller(self, name: str, controller: BaseController) -> None:
+        """
+        Stops a single controller and logs the outcome.
+
+        Args:
+            name (str): The name of the controller.
+            controller (BaseController): The controller to stop.
+        """
+        controller_type = type(controller).__name__
+        try:
+            controller.stop()
+            self.logger.info(f"{controller_type} stopped.")
+        except Exception as ex:
+            self.logger.error(f"Failed to stop {controller_type}: {ex}")
+
+    def close_actuators(self) -> None:
+        """
+        Closes all actuators, stopping their state reporting and releasing their GPIO pins.
+        """
+        for name, actuator in self.actuators.items():
             try:
-                if controller:
-                    controller.stop()
-                    self.logger.info(f"{controller.__class__.__name__} stopped.")
+                actuator.close()
+                self.logger.info(f"Actuator {name} closed.")
             except Exception as ex:
-                self.logger.error(f"Failed to stop {controller.__class__.__name__}: {ex}")
+                self.logger.error(f"Failed to close actuator {name}: {ex}")
 
     def start_sensors_reading(self) -> None:
         """
         Starts the data reading process for all configured sensors.
         """
         for name, sensor in self.sensors.items():
+            sensor_type = type(sensor).__name__
             try:
-                if sensor:
-                    sensor.start_reading()
-                    self.logger.info(f"{sensor.__class__.__name__} reading started.")
+                sensor.start_reading()
+                self.logger.info(f"{sensor_type} reading started.")
             except Exception as ex:
-                self.logger.error(f"Failed to start reading {sensor.__class__.__name__}: {ex}")
+                self.logger.error(f"Failed to start reading {sensor_type}: {ex}")
 
     def stop_sensors_reading(self) -> None:
         """
         Stops the data reading process for all sensors that are currently reading data.
+        The sensors are stopped concurrently, so waiting for a reading in progress does not delay stopping the others.
         """
-        for name, sensor in self.sensors.items():
-            try:
-                if sensor:
-                    sensor.stop_reading()
-                    self.logger.info(f"{sensor.__class__.__name__} stopped reading.")
-            except Exception as ex:
-                self.logger.error(f"Failed to stop reading {sensor.__class__.__name__}: {ex}")
+        if not self.sensors:
+            return
+        with ThreadPoolExecutor(max_workers=len(self.sensors)) as executor:
+            for name, sensor in self.sensors.items():
+                executor.submit(self.stop_sensor_reading, name, sensor)
+
+    def stop_sensor_reading(self, name: str, sensor: BaseSensor) -> None:
+        """
+        Stops the data reading process of a single sensor and logs the outcome.
+
+        Args:
+            name (str): The name of the sensor.
+            sensor (BaseSensor): The sensor to stop.
+        """
+        sensor_type = type(sensor).__name__
+        try:
+            sensor.stop_reading()
+            self.logger.info(f"{sensor_type} stopped reading.")
+        except Exception as ex:
+            self.logger.error(f"Failed to stop reading {sensor_type}: {ex}")
 
     def load_components(self) -> None:
         """
@@ -159,34 +257,37 @@ class App:
         Adds successfully created components to their respective lists within the application.
         """
         config: Dict[str, Any] = self.app_config.get_config()
+        sensors_config: List[Dict[str, Any]] = config.get('sensors') or ()
+        actuators_config: List[Dict[str, Any]] = config.get('actuators') or ()
+        controllers_config: List[Dict[str, Any]] = config.get('controllers') or ()
         try:
-            for sensor_config in config.get('sensors', []):
+            for sensor_config in sensors_config:
                 name = sensor_config['name']
                 sensor = self.create_sensor(sensor_config)
                 if sensor:
                     self.sensors[name] = sensor
 
-            self.logger.debug(f"config.get('actuators', []) len: {len(config.get('actuators', []))}")
-            for actuator_config in config.get('actuators', []):
-                self.logger.debug(f"actuator_config: {actuator_config}")
+            self.logger.debug("actuators config len: %s", len(actuators_config))
+            for actuator_config in actuators_config:
+                self.logger.debug("actuator_config: %s", actuator_config)
                 name = actuator_config['name']
                 actuator = self.create_actuator(actuator_config)
                 if actuator:
                     self.actuators[name] = actuator
-                    self.logger.debug(f"Actuator added to dict on name: {name}")
+                    self.logger.debug("Actuator added to dict on name: %s", name)
                 else:
                     self.logger.error(f"Actuator not created - can not add to dict")
 
-            self.logger.debug(f"config.get('controllers', []) len: {len(config.get('controllers', []))}")
-            for controller_config in config.get('controllers', []):
-                self.logger.debug(f"controller_config: {controller_config}")
-                name = controller_config.get('name', self.generate_unique_name())
+            self.logger.debug("controllers config len: %s", len(controllers_config))
+            for controller_config in controllers_config:
+                self.logger.debug("controller_config: %s", controller_config)
+                name = controller_config.get('name') or self.generate_unique_name()
                 controller = self.create_controller(controller_config)
                 if controller:
-                    while name in self.controllers:
+                    if name in self.controllers:
                         name = self.generate_unique_name()
                     self.controllers[name] = controller
-                    self.logger.debug(f"Controller added to dict on name: {name}")
+                    self.logger.debug("Controller added to dict on name: %s", name)
                 else:
                     self.logger.error(f"Controller not created - can not add to dict")
         except Exception as ex:
@@ -210,37 +311,26 @@ class App:
                 return None
             params = sensor_config.get('params', {})
             params['name'] = sensor_name
-            sensor_params = {
-                'BaseSensor': {'optional': ['read_frequency', 'max_readings', 'start_immediately', 'anomaly_detection'],
-                               'required': ['name']},
-                'TemperatureSensor': {
-                    'optional': ['max_value', 'min_value', 'read_frequency', 'max_readings', 'start_immediately',
-                                 'anomaly_detection'], 'required': ['pin', 'name']},
-                'HumiditySensor': {
-                    'optional': ['max_value', 'min_value', 'read_frequency', 'max_readings', 'start_immediately',
-                                 'anomaly_detection'], 'required': ['pin', 'name']},
-                'LightSensor': {'optional': ['i2c_address', 'min_value', 'max_value', 'read_frequency', 'max_readings',
-                                             'start_immediately', 'anomaly_detection'], 'required': ['name']},
-                'SoilMoistureSensor': {
-                    'optional': ['i2c_address', 'channel', 'min_value', 'max_value', 'read_frequency', 'max_readings',
-                                 'start_immediately', 'anomaly_detection'], 'required': ['name']}
-            }
             valid_params = {'name': sensor_name}
-            if sensor_type in sensor_params:
+            sensor_spec = SENSOR_PARAMS.get(sensor_type)
+            if sensor_spec:
                 for param in params:
-                    if param in sensor_params[sensor_type]['required'] + sensor_params[sensor_type]['optional']:
+                    if param in sensor_spec['allowed']:
                         if isinstance(params[param], (int, float, bool, str)) or params[param] is None:
                             valid_params[param] = params[param]
                         else:
                             self.logger.warning(f"Incorrect type for {param} in {sensor_type}, using default value.")
                     else:
                         self.logger.warning(f"Unknown parameter {param} for {sensor_type}, ignoring it.")
-                missing_required = [r for r in sensor_params[sensor_type]['required'] if r not in valid_params]
+                missing_required = [r for r in sensor_spec['required'] if r not in valid_params]
                 if missing_required:
                     self.logger.error(f"Missing required parameters {missing_required} for {sensor_type}.")
                     return None
                 try:
-                    sensor_class = eval(sensor_type)
+                    sensor_class = load_sensor_class(sensor_type)
+                    if sensor_class is None:
+                        self.logger.error(f"Sensor type {sensor_type} cannot be instantiated.")
+                        return None
                     return sensor_class(**valid_params)
                 except Exception as ex:
                     self.logger.error(f"Failed to create sensor {sensor_type} with params {valid_params}: {ex}")
@@ -268,12 +358,10 @@ class App:
             if not actuator_name:
                 self.logger.error(f"Cant not create actuator without name")
                 return None
-            required_params = ['gpio_pin']
-            optional_params = ['initial_state']
             valid_params = {'name': actuator_name, 'send_state_to_db': True}
             if actuator_type == 'BaseActuator':
                 for param in params:
-                    if param in required_params + optional_params:
+                    if param in ACTUATOR_ALLOWED_PARAMS:
                         if param == 'gpio_pin' and isinstance(params[param], int):
                             valid_params[param] = params[param]
                         elif param == 'initial_state' and isinstance(params[param], bool):
@@ -282,7 +370,7 @@ class App:
                             self.logger.warning(f"Incorrect type for {param} in {actuator_type}, using default value.")
                     else:
                         self.logger.warning(f"Unknown parameter {param} for {actuator_type}, ignoring it.")
-                missing_required = [r for r in required_params if r not in valid_params]
+                missing_required = [r for r in ACTUATOR_REQUIRED_PARAMS if r not in valid_params]
                 if missing_required:
                     self.logger.error(f"Missing required parameters {missing_required} for {actuator_type}.")
                     return None
@@ -341,8 +429,8 @@ class App:
                     activation_time = IrrigationController.calculate_pump_activation_time(**irrigation_params)
                     params['activation_time'] = activation_time
             try:
-                if controller_type in ['IrrigationController', 'VentilationController', 'LightingController']:
-                    controller_class = eval(controller_type)
+                controller_class = CONTROLLER_CLASSES.get(controller_type)
+                if controller_class:
                     controller_instance = controller_class(sensors=sensors_list, actuator=actuator, **params)
                     return controller_instance
                 else:
@@ -380,12 +468,12 @@ class App:
 
     def generate_unique_name(self):
         """
-        Generates a unique name for a controller using a combination of timestamp and UUID.
+        Generates a unique name for a controller from a random 128-bit UUID.
 
         Returns:
             str: A unique name string.
         """
-        unique_name = f"Controller_{int(time.time())}_{uuid.uuid4().hex[:8]}"
+        unique_name = f"Controller_{uuid.uuid4().hex}"
         return unique_name
 
     def run_arduinoLCD(self):
@@ -393,15 +481,18 @@ class App:
         arduino_lcd_manager.start_scan()
         arduino_lcd_manager.start_reading()
 
-    def __del__(self) -> None:
+    def __enter__(self) -> 'App':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
         """
-        Destructor method to ensure all application resources are properly cleaned up before the application exits.
-        Stops the application, sensors, and controllers, and logs the cleanup process.
+        Stops the application when leaving a with block and ensures sensors, controllers and actuators are properly cleaned up.
         """
         try:
-            self.stop_app()
+            self.stop_event.set()
             self.stop_sensors_reading()
             self.stop_controllers()
+            self.close_actuators()
             self.logger.info("Application resources have been cleaned up.")
         except Exception as ex:
             self.logger.error(f"Error during application cleanup: {ex}")
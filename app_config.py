@@ -1,6 +1,13 @@
 import os
 import yaml
 import logging
+import threading
+from typing import Optional, Tuple
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
 
 APP_PATH = os.path.dirname(os.path.abspath(__file__))
 LOG_DIR_PATH = os.path.join(APP_PATH, 'logs')
@@ -14,6 +21,9 @@ DEFAULT_CONFIG = {
         "password": "",
         "database": "garden"
     },
+    "logging": {
+        "use_syslog": False
+    },
     "sensors": [
         {
             "name": "soilMoistureSensor1",
@@ -138,6 +148,7 @@ class AppConfig:
     Attributes:
         config_file (str): Path to the YAML configuration file.
         config_data (dict): Dictionary holding the loaded configuration data.
+        config_file_stat (Optional[Tuple[int, int]]): Modification time (ns) and size of the configuration file when it was last loaded or saved.
 
     Methods:
         load_config: Loads configuration data from the YAML file, merging it with default values.
@@ -148,6 +159,7 @@ class AppConfig:
     """
 
     _instance = None
+    _lock: threading.RLock = threading.RLock()
 
     def __new__(cls, config_file: str):
         """
@@ -160,24 +172,40 @@ class AppConfig:
         Returns:
             AppConfig: An instance of the AppConfig class.
         """
-        if cls._instance is None:
-            cls._instance = super(AppConfig, cls).__new__(cls)
-            cls._instance.config_file = config_file
-            cls._instance.config_data = DEFAULT_CONFIG.copy()
-            cls._instance.load_config()
-        return cls._instance
+        with cls._lock:
+            if cls._instance is None:
+                instance = super(AppConfig, cls).__new__(cls)
+                instance.config_file = config_file
+                instance.config_data = DEFAULT_CONFIG.copy()
+                instance.config_file_stat = None
+                instance.load_config()
+                cls._instance = instance
+            return cls._instance
 
     def load_config(self):
         """
         Load configuration from a YAML file, merging it with default values.
         This method checks if the configuration file exists. If it does, it loads the configuration and merges it with the default values defined in DEFAULT_CONFIG. If the file does not exist, it uses the default configuration.
+        Parsing is skipped when the file's modification time and size have not changed since it was last loaded or saved.
+        """
+        with self._lock:
+            self._load_config()
+
+    def _load_config(self):
+        """
+        Performs the actual configuration load. Must be called with the class lock held.
         """
         logger = logging.getLogger('app_logger')
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as file:
-                    file_config = yaml.safe_load(file) or {}
+                file_stat = self.read_file_stat()
+                if file_stat is not None and file_stat == self.config_file_stat:
+                    logger.info(f"Configuration file {self.config_file} unchanged, skipping reload.")
+                    return
+                with open(self.config_file, 'rb') as file:
+                    file_config = yaml.load(file, Loader=SafeLoader) or {}
                 self.merge_config(file_config)
+                self.config_file_stat = self.read_file_stat()
                 logger.info(f"Configuration loaded from {self.config_file}")
             except Exception as ex:
                 logger.error(f"Failed to load configuration: {ex}")
@@ -194,16 +222,19 @@ class AppConfig:
             file_config (dict): Configuration data loaded from the YAML file.
 
         Compares file_config with DEFAULT_CONFIG and adds any missing keys from
-        DEFAULT_CONFIG to file_config. Updates the config_data and saves changes if needed.
+        DEFAULT_CONFIG to file_config. Replaces config_data with the merged dictionary in a single assignment, so readers never see a partially updated configuration, and saves changes if needed.
         """
-        missing_keys = set(DEFAULT_CONFIG) - set(file_config)
-        if missing_keys:
-            for key in missing_keys:
-                file_config[key] = DEFAULT_CONFIG[key]
-            self.config_data.update(file_config)
-            self.save_config()
-        else:
-            self.config_data = file_config
+        with self._lock:
+            missing_keys = DEFAULT_CONFIG.keys() - file_config.keys()
+            if missing_keys:
+                for key in missing_keys:
+                    file_config[key] = DEFAULT_CONFIG[key]
+                new_config_data = dict(self.config_data)
+                new_config_data.update(file_config)
+                self.config_data = new_config_data
+                self.save_config()
+            else:
+                self.config_data = file_config
 
     def save_config(self):
         """
@@ -211,12 +242,14 @@ class AppConfig:
         Writes the current state of config_data to the YAML file specified in config_file. If an error occurs during saving, it logs an error message.
         """
         logger = logging.getLogger('app_logger')
-        try:
-            with open(self.config_file, 'w', encoding='utf-8') as file:
-                yaml.dump(self.config_data, file, allow_unicode=True, default_flow_style=False)
-                logger.info("Configuration saved successfully.")
-        except Exception as ex:
-            logger.error(f"Failed to save configuration: {ex}")
+        with self._lock:
+            try:
+                with open(self.config_file, 'w', encoding='utf-8') as file:
+                    yaml.dump(self.config_data, file, Dumper=SafeDumper, allow_unicode=True, default_flow_style=False)
+                    logger.info("Configuration saved successfully.")
+                self.config_file_stat = self.read_file_stat()
+            except Exception as ex:
+                logger.error(f"Failed to save configuration: {ex}")
 
     def update_config(self, new_config_data: dict):
         """
@@ -226,12 +259,28 @@ class AppConfig:
             new_config_data (dict): A dictionary containing configuration data to be updated.
         """
         logger = logging.getLogger('app_logger')
+        with self._lock:
+            try:
+                updated_config_data = dict(self.config_data)
+                updated_config_data.update(new_config_data)
+                self.config_data = updated_config_data
+                self.save_config()
+                logger.info("Configuration updated successfully.")
+            except Exception as ex:
+                logger.error(f"Failed to update configuration: {ex}")
+
+    def read_file_stat(self) -> Optional[Tuple[int, int]]:
+        """
+        Read the modification time and size of the configuration file.
+
+        Returns:
+            Optional[Tuple[int, int]]: The modification time in nanoseconds and the size in bytes, or None if the file cannot be accessed.
+        """
         try:
-            self.config_data.update(new_config_data)
-            self.save_config()
-            logger.info("Configuration updated successfully.")
-        except Exception as ex:
-            logger.error(f"Failed to update configuration: {ex}")
+            file_stat = os.stat(self.config_file)
+            return file_stat.st_mtime_ns, file_stat.st_size
+        except OSError:
+            return None
 
     def get_config(self):
         """
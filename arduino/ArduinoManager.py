@@ -1,26 +1,113 @@
-import atexit
+import functools
+import glob
+import itertools
 import json
 import logging
-from typing import Optional, Dict, Any
+import os
+from typing import Optional, Dict, Any, Callable, List, Tuple
 import serial
 import serial.tools.list_ports
 import threading
 import time
+import unicodedata
+import weakref
+from dataclasses import dataclass, field
 from sensors.sensor import BaseSensor
 
+try:
+    import pyudev
+except ImportError:
+    pyudev = None
+
+try:
+    import orjson
+    dump_json = orjson.dumps
+    load_json = orjson.loads
+except ImportError:
+    def dump_json(data: Any) -> bytes:
+        return json.dumps(data, separators=(',', ':')).encode()
+
+    load_json = json.loads
+
+ARDUINO_VID = 0x1a86
+ARDUINO_PID = 0x7523
+SCAN_INTERVAL = 1
+RESET_PULSE_TIME = 0.1
+READY_TIMEOUT = 2.0
+READY_POLL_INTERVAL = 0.01
+LCD_WIDTH = 16
+SERIAL_RX_BUFFER_SIZE = 64
+USB_DEVICES_PATH = "/sys/bus/usb/devices"
+USB_SERIAL_LATENCY_TIMER = "/sys/bus/usb-serial/devices/{}/latency_timer"
+SENSOR_FORMATTERS: Dict[str, Callable[[Any], str]] = {
+    "HumiditySensor": lambda value: f"Humidity: {int(value)} %",
+    "TemperatureSensor": lambda value: f"Temperature: {int(value)} C",
+    "LightSensor": lambda value: f"Light: {int(value)} lux",
+    "SoilMoistureSensor": lambda value: f"Soil: {int(round(value, 2) * 100)} %",
+}
+
+def sanitize_lcd_line(line: str) -> str:
+    """
+    Transliterates a line to ASCII and cuts it to the LCD width, so the frame does not grow with escaped characters the display cannot show anyway.
+
+    Args:
+        line (str): The line of text to display.
+
+    Returns:
+        str: The ASCII line, at most LCD_WIDTH characters long.
+    """
+    return unicodedata.normalize('NFKD', line).encode('ascii', 'ignore')[:LCD_WIDTH].decode('ascii')
+
+@functools.lru_cache(maxsize=256)
+def encode_print_command(line1: str, line2: str) -> bytes:
+    """
+    Builds the encoded print frame for the given LCD lines, sanitized with sanitize_lcd_line.
+    The lines only change with new sensor readings, so the frames are cached and repeated broadcasts reuse the same bytes.
+
+    Args:
+        line1 (str): The first line of text to display.
+        line2 (str): The second line of text to display.
+
+    Returns:
+        bytes: The encoded print command frame.
+    """
+    return ArduinoManager.encode_command({"C": "P", "L1": sanitize_lcd_line(line1), "L2": sanitize_lcd_line(line2)})
+
+@dataclass(slots=True)
+class ArduinoConnection:
+    """
+    A connected Arduino device.
+
+    Attributes:
+        description (str): Description of the serial port reported by the system.
+        connection (serial.Serial): The open serial connection to the device.
+        lock (threading.Lock): Lock serializing request/response exchanges on the connection.
+        buffer (bytearray): Bytes received from the device that do not form a complete line yet.
+        unacknowledged (int): Number of commands sent without waiting for their response, whose responses still have to be discarded.
+    """
+    description: str
+    connection: serial.Serial
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    buffer: bytearray = field(default_factory=bytearray)
+    unacknowledged: int = 0
+
 class ArduinoManager:
     """
     Manages communication and interactions with Arduino devices connected via serial ports.
 
     Attributes:
         logger (logging.Logger): Logger for the class.
-        arduinos (Dict[str, Any]): Stores connected Arduino devices and their serial connections.
+        arduinos (Dict[str, ArduinoConnection]): Stores connected Arduino devices, keyed by device identifier (port).
+        connected (Tuple[Tuple[str, ArduinoConnection], ...]): Immutable snapshot of the items of arduinos, replaced on every change so other threads can iterate it while the scan thread adds or removes devices.
         sensors (Dict[str, BaseSensor]): A dictionary of sensors that the manager will use to gather data.
         scan_thread (Optional[threading.Thread]): Thread for scanning and connecting to Arduino devices.
         reading_thread (Optional[threading.Thread]): Thread for reading sensor data and sending it to Arduino.
-        running (bool): Indicates whether the Arduino scanning and reading processes are active.
+        scan_stop_event (threading.Event): Event that stops the scanning thread.
+        reading_stop_event (threading.Event): Event that stops the reading thread and wakes it up from the wait between updates.
         baud_rate (int): Baud rate for serial communication with Arduino devices.
         update_interval (int): Time interval (in seconds) between sensor data readings and updates sent to Arduino.
+        formatters (Dict[str, Optional[Callable[[Any], str]]]): Formatter resolved for each sensor key, None for unsupported sensor types.
+        finalizer (weakref.finalize): Closes the serial connections when the manager is garbage collected or the interpreter exits.
     """
     def __init__(self, sensors: Dict[str, BaseSensor]) -> None:
         """
@@ -30,19 +117,22 @@ class ArduinoManager:
             sensors (Dict[str, BaseSensor]): A dictionary mapping sensor names to sensor objects.
         """
         self.logger: logging.Logger = logging.getLogger('app_logger')
-        self.arduinos: Dict[str, Any] = {}
+        self.arduinos: Dict[str, ArduinoConnection] = {}
+        self.connected: Tuple[Tuple[str, ArduinoConnection], ...] = ()
         self.sensors: Dict[str, BaseSensor] = sensors
         self.scan_thread: Optional[threading.Thread] = None
         self.reading_thread: Optional[threading.Thread] = None
-        self.running: bool = False
+        self.scan_stop_event: threading.Event = threading.Event()
+        self.reading_stop_event: threading.Event = threading.Event()
         self.baud_rate: int = 115200
         self.update_interval: int = 10
-        atexit.register(self.close_all_connections)
+        self.formatters: Dict[str, Optional[Callable[[Any], str]]] = {}
+        self.finalizer: weakref.finalize = weakref.finalize(self, ArduinoManager.close_connections, self.arduinos)
 
     def start_scan(self) -> None:
         """Starts the scanning process for Arduino devices in a separate thread."""
-        if not self.running:
-            self.running = True
+        if not self.scan_thread:
+            self.scan_stop_event.clear()
             self.scan_thread = threading.Thread(target=self.scan_for_arduinos)
             self.scan_thread.daemon = True
             self.scan_thread.start()
@@ -50,27 +140,116 @@ class ArduinoManager:
 
     def stop_scan(self) -> None:
         """Stops the scanning process for Arduino devices and closes all serial connections."""
-        self.running = False
+        self.scan_stop_event.set()
         if self.scan_thread:
             self.scan_thread.join()
+            self.scan_thread = None
             self.logger.info("Arduino scan stopped.")
-        for device, arduino in self.arduinos.items():
-            arduino['connection'].close()
+        for device, arduino in self.connected:
+            arduino.connection.close()
 
     def scan_for_arduinos(self) -> None:
-        """Scans for Arduino devices connected via serial ports and updates the list of connected devices."""
-        self.logger.debug(f"Start arduino scanning, self.running: {self.running}")
-        while self.running:
-            self.logger.debug(f"Try find new devices")
+        """
+        Scans for Arduino devices connected via serial ports and updates the list of connected devices.
+        When pyudev is available the ports are only enumerated again after a matching tty add/remove event, otherwise they are polled every SCAN_INTERVAL seconds.
+        """
+        self.logger.debug("Start arduino scanning")
+        monitor = self.create_udev_monitor()
+        self.find_arduinos()
+        while not self.scan_stop_event.is_set():
+            if monitor is None:
+                if self.scan_stop_event.wait(SCAN_INTERVAL):
+                    break
+                self.find_arduinos()
+                continue
+            device = monitor.poll(timeout=SCAN_INTERVAL)
+            if device is not None and self.is_arduino_event(device):
+                self.logger.debug("udev %s event for %s", device.action, device.device_node)
+                self.find_arduinos()
+
+    def find_arduinos(self) -> None:
+        """
+        Enumerates the serial ports once and updates the connected Arduino devices.
+        On Linux only the USB devices with the Arduino VID/PID are looked up in sysfs, other systems fall back to listing all serial ports.
+        """
+        self.logger.debug("Try find new devices")
+        connected_arduinos = self.list_arduinos_sysfs()
+        if connected_arduinos is None:
             ports = serial.tools.list_ports.comports()
-            self.logger.debug(f"ports: {ports}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("ports: %r", ports)
             connected_arduinos = {
                 port.device: port.description for port in ports
-                if port.vid == 0x1a86 and port.pid == 0x7523
+                if port.vid == ARDUINO_VID and port.pid == ARDUINO_PID
             }
-            self.logger.debug(f"connected_arduinos: {connected_arduinos}")
-            self.update_arduinos(connected_arduinos)
-            time.sleep(1)
+        self.logger.debug("connected_arduinos: %r", connected_arduinos)
+        self.update_arduinos(connected_arduinos)
+
+    @staticmethod
+    def list_arduinos_sysfs() -> Optional[Dict[str, str]]:
+        """
+        Finds the tty devices of connected Arduinos by reading the USB vendor and product IDs straight from sysfs.
+
+        Returns:
+            Optional[Dict[str, str]]: Detected Arduino devices and their descriptions, or None if sysfs is not available.
+        """
+        if not os.path.isdir(USB_DEVICES_PATH):
+            return None
+        connected_arduinos = {}
+        for vendor_path in glob.glob(os.path.join(USB_DEVICES_PATH, '*', 'idVendor')):
+            usb_device = os.path.dirname(vendor_path)
+            try:
+                with open(vendor_path) as file:
+                    vid = int(file.read(), 16)
+                with open(os.path.join(usb_device, 'idProduct')) as file:
+                    pid = int(file.read(), 16)
+            except (OSError, ValueError):
+                continue
+            if vid != ARDUINO_VID or pid != ARDUINO_PID:
+                continue
+            try:
+                with open(os.path.join(usb_device, 'product')) as file:
+                    description = file.read().strip()
+            except OSError:
+                description = 'USB Serial'
+            for tty_path in glob.glob(os.path.join(usb_device, '*', 'ttyUSB*')):
+                connected_arduinos[os.path.join('/dev', os.path.basename(tty_path))] = description
+        return connected_arduinos
+
+    def create_udev_monitor(self) -> Optional[Any]:
+        """
+        Creates a udev monitor for tty subsystem events.
+
+        Returns:
+            Optional[pyudev.Monitor]: The started monitor, or None if pyudev is not available and the ports have to be polled.
+        """
+        if pyudev is None:
+            self.logger.debug("pyudev not available, polling serial ports.")
+            return None
+        try:
+            monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+            monitor.filter_by('tty')
+            monitor.start()
+            return monitor
+        except Exception as ex:
+            self.logger.warning(f"Could not create udev monitor, polling serial ports: {ex}")
+            return None
+
+    @staticmethod
+    def is_arduino_event(device: Any) -> bool:
+        """
+        Checks whether a udev event concerns a supported Arduino device.
+
+        Args:
+            device (pyudev.Device): The device reported by the udev monitor.
+
+        Returns:
+            bool: True if the event is an add/remove of a device with the Arduino VID/PID.
+        """
+        if device.action not in ('add', 'remove'):
+            return False
+        return (device.get('ID_VENDOR_ID') == f"{ARDUINO_VID:04x}"
+                and device.get('ID_MODEL_ID') == f"{ARDUINO_PID:04x}")
 
     def update_arduinos(self, connected_arduinos: Dict[str, str]) -> None:
         """
@@ -79,24 +258,80 @@ class ArduinoManager:
         Args:
             connected_arduinos (Dict[str, str]): A dictionary of detected Arduino devices and their descriptions.
         """
+        changed = False
         for device, description in connected_arduinos.items():
             if device not in self.arduinos:
                 try:
                     connection = serial.Serial(device, self.baud_rate, timeout=5)
+                    self.set_low_latency(device)
                     connection.setDTR(False)
-                    time.sleep(1)
+                    time.sleep(RESET_PULSE_TIME)
                     connection.flushInput()
                     connection.setDTR(True)
-                    time.sleep(2)
-                    self.arduinos[device] = {'description': description, 'connection': connection}
+                    self.wait_ready(connection)
+                    self.arduinos[device] = ArduinoConnection(description, connection)
+                    changed = True
                     self.logger.info(f"Arduino connected: {device}")
                 except serial.SerialException as ex:
                     self.logger.error(f"Could not open serial connection to {device}: {ex}")
-        for device in list(self.arduinos):
+        for device, arduino in self.connected:
             if device not in connected_arduinos:
-                self.arduinos[device]['connection'].close()
                 del self.arduinos[device]
+                changed = True
+                with arduino.lock:
+                    arduino.connection.close()
                 self.logger.info(f"Arduino disconnected: {device}")
+        if changed:
+            self.connected = tuple(self.arduinos.items())
+
+    @staticmethod
+    def wait_ready(connection: serial.Serial, timeout: float = READY_TIMEOUT, interval: float = READY_POLL_INTERVAL) -> bool:
+        """
+        Waits for an Arduino to finish booting after a reset by polling its input buffer.
+
+        Args:
+            connection (serial.Serial): The freshly opened serial connection.
+            timeout (float): Maximum time to wait, in seconds. Defaults to READY_TIMEOUT.
+            interval (float): Time between checks of the input buffer, in seconds. Defaults to READY_POLL_INTERVAL.
+
+        Returns:
+            bool: True if the Arduino sent data before the timeout, False if the whole timeout elapsed.
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if connection.in_waiting > 0:
+                return True
+            time.sleep(interval)
+        return False
+
+    def set_low_latency(self, device: str) -> None:
+        """
+        Lowers the USB-serial latency timer of the device to 1 ms, so short responses are not held back by the default 16 ms timer.
+        Only supported by drivers exposing the latency_timer attribute in sysfs; failures are logged at debug level and ignored.
+
+        Args:
+            device (str): The device identifier (port) of the Arduino.
+        """
+        path = USB_SERIAL_LATENCY_TIMER.format(os.path.basename(device))
+        try:
+            with open(path, 'w') as file:
+                file.write("1")
+            self.logger.debug("Latency timer of %s set to 1 ms", device)
+        except OSError as ex:
+            self.logger.debug("Could not set latency timer of %s: %s", device, ex)
+
+    @staticmethod
+    def encode_command(command: Dict[str, Any]) -> bytes:
+        """
+        Serializes a command into a single newline-terminated frame.
+
+        Args:
+            command (Dict[str, Any]): The command to send, formatted as a dictionary.
+
+        Returns:
+            bytes: The encoded frame, ready to be written to a serial connection.
+        """
+        return dump_json(command) + b'\n'
 
     def sendMessage(self, arduino_device: str, command: Dict[str, Any]) -> None:
         """
@@ -106,26 +341,116 @@ class ArduinoManager:
             arduino_device (str): The device identifier (port) of the Arduino to send the command to.
             command (Dict[str, Any]): The command to send, formatted as a dictionary.
         """
-        if arduino_device in self.arduinos:
-            json_data = json.dumps(command) + '\n'
-            self.arduinos[arduino_device]['connection'].write(json_data.encode())
-        else:
+        self.sendRaw(arduino_device, self.encode_command(command))
+
+    def sendRaw(self, arduino_device: str, payload: bytes) -> bool:
+        """
+        Writes an already encoded frame to a specific Arduino device in a single write call.
+
+        Args:
+            arduino_device (str): The device identifier (port) of the Arduino to send the frame to.
+            payload (bytes): The encoded frame, as returned by encode_command.
+
+        Returns:
+            bool: True if the frame was written, False if the device is not connected.
+        """
+        arduino = self.arduinos.get(arduino_device)
+        if arduino is None:
             self.logger.error(f"Arduino device {arduino_device} not found.")
+            return False
+        arduino.connection.write(payload)
+        return True
 
     def broadcast_message(self, line1: str, line2: str) -> None:
         """
         Sends a message to all connected Arduino devices.
+        The print command is serialized once and written to every device without waiting for the responses, so the broadcast costs one write per device instead of one round trip.
 
         Args:
             line1 (str): The first line of the message.
             line2 (str): The second line of the message.
         """
-        for arduino_device in self.arduinos.keys():
-            self.commandPrint(arduino_device, line1, line2)
+        if not line1 or not line2:
+            return
+        payload = encode_print_command(line1, line2)
+        if len(payload) >= SERIAL_RX_BUFFER_SIZE:
+            self.logger.warning(f"PRINT command of {len(payload)} bytes exceeds the Arduino serial buffer, not sent.")
+            return
+        for arduino_device, _ in self.connected:
+            self.sendWithoutResponse(arduino_device, payload)
+
+    def sendWithoutResponse(self, arduino_device: str, payload: bytes) -> bool:
+        """
+        Writes a frame to an Arduino device without waiting for its response.
+        The response is discarded later: responses that already arrived are dropped here, the rest by the next request on the connection.
+
+        Args:
+            arduino_device (str): The device identifier (port) of the Arduino.
+            payload (bytes): The encoded frame, as returned by encode_command.
+
+        Returns:
+            bool: True if the frame was written, False if the device is not connected.
+        """
+        arduino = self.arduinos.get(arduino_device)
+        if arduino is None:
+            self.logger.error(f"Arduino device {arduino_device} not found.")
+            return False
+        with arduino.lock:
+            waiting = arduino.connection.in_waiting
+            if waiting:
+                arduino.buffer += arduino.connection.read(waiting)
+                received = arduino.buffer.count(b'\n')
+                if received:
+                    del arduino.buffer[:arduino.buffer.rfind(b'\n') + 1]
+                    arduino.unacknowledged = max(0, arduino.unacknowledged - received)
+            if not self.sendRaw(arduino_device, payload):
+                return False
+            arduino.unacknowledged += 1
+            return True
+
+    def request(self, arduino_device: str, payload: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Writes a frame to an Arduino device and reads its response while holding the lock of that connection, so concurrent callers do not interleave their frames.
+
+        Args:
+            arduino_device (str): The device identifier (port) of the Arduino.
+            payload (bytes): The encoded frame, as returned by encode_command.
+
+        Returns:
+            Optional[Dict[str, Any]]: The response of the Arduino, or None if the device is not connected or did not answer.
+        """
+        return self.request_batch(arduino_device, [payload])[0]
+
+    def request_batch(self, arduino_device: str, payloads: List[bytes]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Writes several frames to an Arduino device in a single write and then reads one response per frame, holding the lock of that connection for the whole exchange.
+        The Arduino handles the queued commands in order, so consecutive commands cost one write instead of one per command.
+
+        Args:
+            arduino_device (str): The device identifier (port) of the Arduino.
+            payloads (List[bytes]): The encoded frames, as returned by encode_command.
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: The responses in the order of the frames, None for each frame that was not answered.
+        """
+        arduino = self.arduinos.get(arduino_device)
+        if arduino is None:
+            self.logger.error(f"Arduino device {arduino_device} not found.")
+            return [None] * len(payloads)
+        with arduino.lock:
+            while arduino.unacknowledged:
+                arduino.unacknowledged -= 1
+                if self.readMessage(arduino_device) is None:
+                    arduino.unacknowledged = 0
+            if not self.sendRaw(arduino_device, b''.join(payloads)):
+                return [None] * len(payloads)
+            return [self.readMessage(arduino_device) for _ in payloads]
 
     def readMessage(self, arduino_device: str) -> Optional[Dict[str, Any]]:
         """
         Reads a message from a specific Arduino device.
+        Reads whatever the port has buffered in one call instead of scanning for the newline byte by byte, and blocks until a full line arrives or the serial timeout set when the connection was opened expires.
+        Bytes received after the newline are kept for the next read.
 
         Args:
             arduino_device (str): The device identifier (port) of the Arduino to read the message from.
@@ -133,22 +458,21 @@ class ArduinoManager:
         Returns:
             Optional[Dict[str, Any]]: The message read from the Arduino, if any, parsed as a dictionary.
         """
-        tempMessage = None
-        timeout = 5
-        start_time = time.time()
-        while True:
-            if self.arduinos[arduino_device]['connection'].in_waiting > 0:
-                line = self.arduinos[arduino_device]['connection'].readline().decode().strip()
-                try:
-                    tempMessage = json.loads(line)
-                    break
-                except json.JSONDecodeError:
-                    tempMessage = None
-                    break
-            elif time.time() - start_time > timeout:
-                tempMessage = None
-                break
-        return tempMessage
+        arduino = self.arduinos[arduino_device]
+        buffer = arduino.buffer
+        end = buffer.find(b'\n')
+        while end < 0:
+            chunk = arduino.connection.read(max(1, arduino.connection.in_waiting))
+            if not chunk:
+                return None
+            buffer += chunk
+            end = buffer.find(b'\n', len(buffer) - len(chunk))
+        line = bytes(buffer[:end])
+        del buffer[:end + 1]
+        try:
+            return load_json(line.strip())
+        except ValueError:
+            return None
 
     def commandPrint(self, arduino_device: str, line1: str, line2: str) -> bool:
         """
@@ -166,9 +490,11 @@ class ArduinoManager:
             self.logger.warning("No arduino indicated")
             return False
         if line1 and line2:
-            command = {"C": "P", "L1": line1, "L2": line2}
-            self.sendMessage(arduino_device, command)
-            tempOutput = self.readMessage(arduino_device)
+            payload = encode_print_command(line1, line2)
+            if len(payload) >= SERIAL_RX_BUFFER_SIZE:
+                self.logger.warning(f"PRINT command of {len(payload)} bytes exceeds the Arduino serial buffer, not sent.")
+                return False
+            tempOutput = self.request(arduino_device, payload)
             self.logger.info(f"Return message after PRINT command: {tempOutput}")
             return True
         return False
@@ -190,8 +516,7 @@ class ArduinoManager:
             return False
         if element and value:
             command = {"C": "S", "E": element, "V": value}
-            self.sendMessage(arduino_device, command)
-            tempOutput = self.readMessage(arduino_device)
+            tempOutput = self.request(arduino_device, self.encode_command(command))
             self.logger.info(f"Return message after SET command: {tempOutput}")
             return True
         return False
@@ -212,24 +537,32 @@ class ArduinoManager:
             return False
         if element:
             command = {"C": "G", "E": element}
-            self.sendMessage(arduino_device, command)
-            tempOutput = self.readMessage(arduino_device)
+            tempOutput = self.request(arduino_device, self.encode_command(command))
             self.logger.info(f"Return message after GET command: {tempOutput}")
             return tempOutput
         return False
 
-    def takeDeviceInfo(self, arduino_device: str):
-        time.sleep(0.2)
-        device_type = self.arduinos[arduino_device]['connection'].commandGET("devicetype")
-        self.logger.info(f"devicetype: {device_type}")
-        time.sleep(0.2)
-        device_version = self.arduinos[arduino_device]['connection'].commandGET("version")
-        self.logger.info(f"version: {device_version}")
-        time.sleep(0.2)
+    def takeDeviceInfo(self, arduino_device: str) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Retrieves the device type and firmware version of an Arduino device.
+        Both GET commands are sent in one write and each response is awaited only as long as it takes to arrive, bounded by the serial timeout.
+
+        Args:
+            arduino_device (str): The device identifier (port) of the Arduino.
+
+        Returns:
+            Dict[str, Optional[Dict[str, Any]]]: The responses to the "devicetype" and "version" GET commands, None for a command that was not answered.
+        """
+        elements = ("devicetype", "version")
+        responses = self.request_batch(arduino_device, [self.encode_command({"C": "G", "E": element}) for element in elements])
+        for element, response in zip(elements, responses):
+            self.logger.info(f"{element}: {response}")
+        return dict(zip(elements, responses))
 
     def start_reading(self) -> None:
         """Starts the sensor data reading and broadcasting process in a separate thread."""
         if not self.reading_thread and self.sensors:
+            self.reading_stop_event.clear()
             self.reading_thread = threading.Thread(target=self.iterate_sensors)
             self.reading_thread.daemon = True
             self.reading_thread.start()
@@ -237,21 +570,28 @@ class ArduinoManager:
 
     def stop_reading(self) -> None:
         """Stops the sensor data reading and broadcasting process."""
-        self.running = False
+        self.reading_stop_event.set()
         if self.reading_thread:
             self.reading_thread.join()
+            self.reading_thread = None
             self.logger.info("Sensor reading stopped.")
 
     def iterate_sensors(self) -> None:
-        """Iterates over sensors, reads data, and sends updates to connected Arduino devices."""
-        sensor_keys = list(self.sensors.keys())
-        sensor_index = 0
-        while self.running:
-            sensor1_key = sensor_keys[sensor_index % len(sensor_keys)]
-            sensor2_key = sensor_keys[(sensor_index + 1) % len(sensor_keys)]
-            self.send_sensor_data_to_arduino(sensor1_key, sensor2_key)
-            sensor_index += 1
-            time.sleep(self.update_interval)
+        """
+        Iterates over sensors, reads data, and sends updates to connected Arduino devices.
+        Consecutive sensors are shown in pairs taken from a precomputed cycle, which is rebuilt when sensors are added or removed.
+        """
+        sensor_keys = ()
+        sensor_pairs = iter(())
+        while not self.reading_stop_event.is_set():
+            current_keys = tuple(self.sensors)
+            if current_keys != sensor_keys:
+                sensor_keys = current_keys
+                sensor_pairs = itertools.cycle(tuple(zip(sensor_keys, sensor_keys[1:] + sensor_keys[:1])))
+            if sensor_keys:
+                sensor1_key, sensor2_key = next(sensor_pairs)
+                self.send_sensor_data_to_arduino(sensor1_key, sensor2_key)
+            self.reading_stop_event.wait(self.update_interval)
 
     def send_sensor_data_to_arduino(self, sensor1_key: str, sensor2_key: str) -> None:
         """
@@ -281,28 +621,31 @@ class ArduinoManager:
         if sensor_reading is None:
             return "Data not available"
 
-        sensor_type = self.sensors[sensor_key].__class__.__name__
-        value = sensor_reading.get('value', 'N/A')
-
-        if sensor_type == "HumiditySensor":
-            return f"Humidity: {int(value)} %"
-        elif sensor_type == "TemperatureSensor":
-            return f"Temperature: {int(value)} C"
-        elif sensor_type == "LightSensor":
-            return f"Light: {int(value)} lux"
-        elif sensor_type == "SoilMoistureSensor":
-            return f"Soil: {int(round(value,2)*100)} %"
-        else:
+        formatter = self.formatters.get(sensor_key)
+        if formatter is None and sensor_key not in self.formatters:
+            formatter = SENSOR_FORMATTERS.get(type(self.sensors[sensor_key]).__name__)
+            self.formatters[sensor_key] = formatter
+        if formatter is None:
             return "Unknown"
+        return formatter(sensor_reading.get('value', 'N/A'))
 
     def close_all_connections(self) -> None:
         """Closes all serial connections to Arduino devices."""
-        for device, arduino in self.arduinos.items():
-            arduino['connection'].close()
-            self.logger.info(f"Connection to Arduino {device} closed.")
-
-    def __del__(self) -> None:
-        """Destructor method that ensures all Arduino serial connections are closed upon object deletion."""
-        for device, arduino in self.arduinos.items():
-            arduino['connection'].close()
-            self.logger.info(f"Connection to Arduino {device} closed.")
+        self.close_connections(self.arduinos)
+
+    @staticmethod
+    def close_connections(arduinos: Dict[str, ArduinoConnection]) -> None:
+        """
+        Closes the serial connections of the given Arduino devices.
+        Does not reference the manager, so it can be run by its finalizer. Closing an already closed connection has no effect.
+
+        Args:
+            arduinos (Dict[str, ArduinoConnection]): The connected Arduino devices, keyed by device identifier (port).
+        """
+        logger = logging.getLogger('app_logger')
+        for device, arduino in list(arduinos.items()):
+            try:
+                arduino.connection.close()
+                logger.info(f"Connection to Arduino {device} closed.")
+            except Exception as ex:
+                logger.error(f"Error closing connection to Arduino {device}: {ex}")
@@ -1,10 +1,25 @@
 import datetime
+import functools
 import time
 import logging
+import operator
 import threading
-from typing import List, Dict, Callable, Optional, Union
+from collections import deque
+from typing import List, Dict, Callable, Optional, Union, Deque, Tuple
 from actuators.actuator import BaseActuator
+from controllers.controller_scheduler import ControllerScheduler
 from sensors.sensor import BaseSensor
+from timer_service import TimerService
+
+REEVALUATION_TICKS = 10
+AVERAGE_READINGS = 10
+AVERAGE_MINIMUM_ENTRIES = 5
+AVERAGE_MAX_AGE_SECONDS = 800
+
+COMPARISONS: Dict[str, Callable] = {
+    "HIGHER": operator.gt,
+    "LOWER": operator.lt,
+}
 
 class BaseController:
     def __init__(self, sensors: List[Dict],  actuator: Optional[BaseActuator] = None, check_interval: float = 60 , activation_time: Optional[int] = None, cooldown_period: int = 60, start_hour: Optional[int] = None, end_hour: Optional[int] = None):
@@ -22,16 +37,32 @@ class BaseController:
         """
         self.logger: logging.Logger = logging.getLogger('app_logger')
         self.check_interval: float = check_interval
-        self.cooldown_period: datetime.timedelta = datetime.timedelta(seconds=cooldown_period)
+        self.cooldown_period: float = cooldown_period
         self.start_hour: Optional[int] = start_hour
         self.end_hour: Optional[int] = end_hour
         self.activation_time: Optional[int] = activation_time
-        self.sensors: List[Dict[str, Union[BaseSensor, int, Callable]]] = [self.validation_sensor(sensor_dict) for sensor_dict in sensors if self.validation_sensor(sensor_dict)]
+        self.sensors: List[Dict[str, Union[BaseSensor, int, Callable]]] = []
+        self.sensor_objects: List[BaseSensor] = []
+        self.thresholds: List[Union[int, float]] = []
+        self.comparisons: List[Callable] = []
+        self.anomaly_reset_times: List[float] = []
         self.actuator: Optional[BaseActuator] = actuator
-        self.thread: Optional[threading.Thread] = None
-        self.running: bool = False
-        self.last_activation: Optional[datetime.datetime] = None
-        self.last_deactivation: Optional[datetime.datetime] = None
+        self.activation_needed: bool = False
+        self.ticks_since_evaluation: int = 0
+        self.deactivation_deadline: Optional[float] = None
+        self.anomaly_detection_timers: List[int] = []
+        self.new_readings: threading.Event = threading.Event()
+        self.new_readings.set()
+        self.recent_readings: Dict[BaseSensor, Deque[Tuple[float, float]]] = {}
+        self.recent_sums: Dict[BaseSensor, float] = {}
+        self.recent_lock: threading.Lock = threading.Lock()
+        self.last_evaluations: Dict[Tuple[BaseSensor, Union[int, float], Callable], Tuple[Tuple[float, float], bool]] = {}
+        for sensor_dict in sensors:
+            validated_sensor = self.validation_sensor(sensor_dict)
+            if validated_sensor:
+                self.register_sensor(validated_sensor)
+        self.last_activation: Optional[float] = None
+        self.last_deactivation: Optional[float] = None
 
     def validation_sensor(self, sensor_dict: Dict) -> Optional[Dict]:
         """
@@ -74,7 +105,8 @@ class BaseController:
         """
         sensor = self.validation_sensor(sensor_dict)
         if sensor:
-            self.sensors.append(sensor)
+            self.register_sensor(sensor)
+            self.new_readings.set()
             self.logger.info(f"Sensor added successfully: {sensor_dict}")
         else:
             self.logger.warning(f"Failed to add sensor due to validation failure: {sensor_dict}")
@@ -91,86 +123,161 @@ class BaseController:
 
     def start(self):
         """
-        Starts the controller loop in a separate thread.
+        Starts the controller by registering it with the shared ControllerScheduler, which calls tick from its single thread.
         """
-        if not self.running:
-            self.running = True
-            try:
-                self.thread = threading.Thread(target=self.control_loop, daemon=True)
-                self.thread.start()
+        try:
+            if ControllerScheduler().register(self):
                 self.logger.info("Controller loop started successfully.")
-            except Exception as ex:
-                self.logger.error(f"Failed to start controller loop: {ex}")
-                self.running = False
+        except Exception as ex:
+            self.logger.error(f"Failed to start controller loop: {ex}")
 
     def stop(self):
         """
-        Stops the controller loop if it's running.
+        Stops the controller if it's running by unregistering it from the ControllerScheduler, waiting for a check in progress to finish.
+        If a timed deactivation is pending, the actuator is deactivated right away, so it is not left running after the controller stopped.
         """
-        self.running = False
-        if self.thread:
-            try:
-                self.thread.join()
+        try:
+            if ControllerScheduler().unregister(self):
+                self.activation_needed = False
+                self.ticks_since_evaluation = 0
                 self.logger.info("Controller loop stopped successfully.")
-            except Exception as ex:
-                self.logger.error(f"Failed to stop controller loop properly: {ex}")
+        except Exception as ex:
+            self.logger.error(f"Failed to stop controller loop properly: {ex}")
+        if self.deactivation_deadline is not None:
+            self.deactivation_deadline = None
+            self.logger.info("Pending deactivation cancelled, deactivating actuator now.")
+            self.deactivate_actuator()
 
-    def control_loop(self):
+    def register_sensor(self, sensor_dict: Dict) -> None:
         """
-        The main loop that checks sensors and controls the actuator based on the configured logic.
+        Stores a validated sensor configuration. Besides the configuration dictionaries kept in sensors, the sensor, threshold and comparison are stored in the parallel sensor_objects, thresholds and comparisons lists the control loop iterates over.
+        The time after which anomaly detection is re-enabled following an activation, ten read periods of the sensor, is computed once here and kept in anomaly_reset_times.
+
+        Args:
+            sensor_dict (Dict): Validated sensor configuration dictionary.
         """
-        self.logger.info("Control loop started.")
-        while self.running:
-            try:
-                self.logger.debug("Checking conditions...")
-                time.sleep(self.check_interval)
-                if not self.is_within_operating_hours():
-                    self.logger.info("Outside of operating hours, skipping activation checks.")
-                    continue
-                if not self.check_if_cooldown_passed():
-                    self.logger.info("Cooldown period has not passed, skipping activation checks.")
-                    continue
-                activation_needed = False
-                for sensor_dict in self.sensors:
+        self.sensors.append(sensor_dict)
+        self.sensor_objects.append(sensor_dict['sensor'])
+        self.thresholds.append(sensor_dict['threshold'])
+        self.comparisons.append(sensor_dict['comparison'])
+        self.anomaly_reset_times.append(sensor_dict['sensor'].get_read_frequency() * 10)
+        self.track_sensor(sensor_dict['sensor'])
+
+    def track_sensor(self, sensor: BaseSensor) -> None:
+        """
+        Starts keeping the rolling window of the last AVERAGE_READINGS readings of a sensor, seeded with the readings it already stored, and subscribes to its new readings.
+
+        Args:
+            sensor (BaseSensor): The sensor to track.
+        """
+        with self.recent_lock:
+            if sensor in self.recent_readings:
+                return
+            window = deque(((reading['timestamp'], reading['value']) for reading in sensor.get_all_readings()), maxlen=AVERAGE_READINGS)
+            self.recent_readings[sensor] = window
+            self.recent_sums[sensor] = sum(value for _, value in window)
+        sensor.add_listener(self.on_new_reading)
+
+    def on_new_reading(self, sensor: BaseSensor, reading: Dict) -> None:
+        """
+        Sensor listener adding the reading to the rolling window of the sensor and marking that the sensor readings changed, so the next loop iteration evaluates the sensors again.
+
+        Args:
+            sensor (BaseSensor): The sensor that stored a new reading.
+            reading (Dict): The new reading.
+        """
+        with self.recent_lock:
+            window = self.recent_readings.get(sensor)
+            if window is not None:
+                if len(window) == window.maxlen:
+                    self.recent_sums[sensor] -= window[0][1]
+                window.append((reading['timestamp'], reading['value']))
+                self.recent_sums[sensor] += reading['value']
+        self.new_readings.set()
+
+    def tick(self):
+        """
+        A single check of the sensors that controls the actuator based on the configured logic. Called by the ControllerScheduler after each wait returned by next_wait_timeout.
+        The sensors are only evaluated again when one of them reported a new reading, or every REEVALUATION_TICKS checks so that readings expiring by age are taken into account. Otherwise the previous result is reused, but only to keep the actuator in its current state: the actuator is never activated without evaluating the sensors in the same check.
+        With an activation time, the controller keeps a single deactivation deadline and is checked early if it falls before the next check. Each evaluation that still triggers while the actuator is active moves the deadline to activation_time from now.
+        """
+        try:
+            self.logger.debug("Checking conditions...")
+            now = datetime.datetime.now()
+            current_time = time.time()
+            monotonic_now = time.monotonic()
+            if self.deactivation_deadline is not None and monotonic_now >= self.deactivation_deadline:
+                self.deactivation_deadline = None
+                self.logger.info("Deactivating actuator after activation time.")
+                self.deactivate_actuator()
+                return
+            if not self.is_within_operating_hours(now):
+                self.logger.info("Outside of operating hours, skipping activation checks.")
+                return
+            if not self.check_if_cooldown_passed(monotonic_now):
+                self.logger.info("Cooldown period has not passed, skipping activation checks.")
+                return
+            self.ticks_since_evaluation += 1
+            evaluated = False
+            actuator_state = self.actuator.get_state() if self.actuator else None
+            if (self.new_readings.is_set() or self.ticks_since_evaluation >= REEVALUATION_TICKS
+                    or (self.activation_needed and not actuator_state)):
+                evaluated = True
+                self.new_readings.clear()
+                self.ticks_since_evaluation = 0
+                self.activation_needed = False
+                for sensor, threshold, comparison in zip(self.sensor_objects, self.thresholds, self.comparisons):
                     try:
-                        if self.check_sensor(sensor_dict):
-                            activation_needed = True
-                            self.logger.info(f"Sensor {sensor_dict['sensor']} triggered activation.")
+                        if self.evaluate_sensor(sensor, threshold, comparison, current_time):
+                            self.activation_needed = True
+                            self.logger.info(f"Sensor {sensor} triggered activation.")
                             break
                     except Exception as ex:
                         self.logger.error(f"Error during sensor check: {ex}")
-                actuator_state = self.actuator.get_state() if self.actuator else None
-                self.logger.debug(f"Actuator state: {actuator_state}, Activation needed: {activation_needed}")
-                if activation_needed:
-                    if not actuator_state:
-                        self.logger.info("Activating actuator.")
-                        self.activate_actuator()
-                        if self.activation_time:
-                            self.logger.info(f"Actuator will deactivate after {self.activation_time} seconds.")
-                            threading.Timer(self.activation_time, self.deactivate_actuator).start()
-                    elif self.activation_time and (
-                            datetime.datetime.now() - self.last_activation).total_seconds() > self.activation_time:
-                        self.logger.info("Deactivating actuator after activation time.")
-                        self.deactivate_actuator()
-                else:
-                    if actuator_state and not self.activation_time:
-                        self.logger.info("Deactivating actuator due to sensor deactivation criteria.")
-                        self.deactivate_actuator()
-            except Exception as ex:
-                self.logger.error(f"Error during control loop execution: {ex}")
-        self.logger.info("Control loop stopped.")
+            self.logger.debug("Actuator state: %s, Activation needed: %s", actuator_state, self.activation_needed)
+            if self.activation_needed:
+                if not actuator_state:
+                    self.logger.info("Activating actuator.")
+                    self.activate_actuator()
+                    if self.activation_time:
+                        self.logger.info(f"Actuator will deactivate after {self.activation_time} seconds.")
+                        self.deactivation_deadline = monotonic_now + self.activation_time
+                elif self.activation_time and (evaluated or self.deactivation_deadline is None):
+                    self.logger.debug("Activation still needed, deactivation postponed by %s seconds.", self.activation_time)
+                    self.deactivation_deadline = monotonic_now + self.activation_time
+            else:
+                if actuator_state and not self.activation_time:
+                    self.logger.info("Deactivating actuator due to sensor deactivation criteria.")
+                    self.deactivate_actuator()
+        except Exception as ex:
+            self.logger.error(f"Error during control loop execution: {ex}")
+
+    def next_wait_timeout(self) -> float:
+        """
+        Returns how long the scheduler waits before the next check of this controller: the check interval, or less if the deactivation deadline comes first.
+
+        Returns:
+            float: The timeout in seconds.
+        """
+        deadline = self.deactivation_deadline
+        if deadline is None:
+            return self.check_interval
+        return max(0.0, min(self.check_interval, deadline - time.monotonic()))
 
-    def check_if_cooldown_passed(self) -> bool:
+    def check_if_cooldown_passed(self, now: Optional[float] = None) -> bool:
         """
         Checks if the cooldown period has passed since the last actuator deactivation.
+        Measured on the monotonic clock, so wall-clock adjustments do not shorten or extend the cooldown.
+
+        Args:
+            now (Optional[float]): The current time.monotonic() value, taken once per control loop iteration. Defaults to the time of the call.
 
         Returns:
             bool: True if the cooldown has passed, False otherwise.
         """
         if self.last_deactivation is not None:
-            time_since_reference = datetime.datetime.now() - self.last_deactivation
-            self.logger.debug(
-                f"time_since_reference: {time_since_reference}, cooldown_period: {self.cooldown_period}")
+            time_since_reference = (now if now is not None else time.monotonic()) - self.last_deactivation
+            self.logger.debug("time_since_reference: %s, cooldown_period: %s", time_since_reference, self.cooldown_period)
 
             if time_since_reference >= self.cooldown_period:
                 self.logger.info("The cooldown has passed, allowing new activations.")
@@ -182,79 +289,141 @@ class BaseController:
             self.logger.info("No previous deactivation, allowing activations.")
             return True
 
-    def is_within_operating_hours(self) -> bool:
+    def is_within_operating_hours(self, now: Optional[datetime.datetime] = None) -> bool:
         """
         Checks if the current time is within the operating hours, correctly handling cases where the operating period spans across midnight.
 
+        Args:
+            now (Optional[datetime.datetime]): The current time, taken once per control loop iteration. Defaults to the time of the call.
+
         Returns:
             bool: True if within operating hours, False otherwise.
         """
-        current_time = datetime.datetime.now()
         if self.start_hour is not None and self.end_hour is not None:
-            current_hour = current_time.hour
+            current_hour = (now or datetime.datetime.now()).hour
             if self.start_hour < self.end_hour:
                 in_hours = self.start_hour <= current_hour < self.end_hour
             else:
                 in_hours = current_hour >= self.start_hour or current_hour < self.end_hour
-            self.logger.debug(f"Operating hours check, Current hour: {current_hour}, start_hour: {self.start_hour}, end_hour: {self.end_hour}, Within hours: {in_hours}")
+            self.logger.debug("Operating hours check, Current hour: %s, start_hour: %s, end_hour: %s, Within hours: %s", current_hour, self.start_hour, self.end_hour, in_hours)
             return in_hours
         return True
 
-    def check_sensor(self, sensor_dict: Dict) -> bool:
+    def check_sensor(self, sensor_dict: Dict, current_time: Optional[float] = None) -> bool:
         """
         Checks if a sensor's reading meets its activation criteria.
 
         Args:
             sensor_dict (Dict): Sensor configuration dictionary.
+            current_time (Optional[float]): The current Unix timestamp, taken once per control loop iteration. Defaults to the time of the call.
+
+        Returns:
+            bool: True if the sensor meets the activation criteria, False otherwise.
+        """
+        return self.evaluate_sensor(sensor_dict['sensor'], sensor_dict['threshold'], sensor_dict['comparison'], current_time)
+
+    def evaluate_sensor(self, sensor: BaseSensor, threshold: Union[int, float], comparison: Callable, current_time: Optional[float] = None) -> bool:
+        """
+        Checks if a sensor's reading meets its activation criteria, given the already unpacked sensor configuration.
+        For tracked sensors the result is remembered together with the timestamps of the newest and oldest reading in the rolling window. While no new reading arrived and the oldest reading has not aged out, the average cannot have changed and the remembered result is returned.
+
+        Args:
+            sensor (BaseSensor): The sensor to check.
+            threshold (Union[int, float]): The threshold the average reading is compared with.
+            comparison (Callable): The comparison applied to the average reading and the threshold.
+            current_time (Optional[float]): The current Unix timestamp, taken once per control loop iteration. Defaults to the time of the call.
 
         Returns:
             bool: True if the sensor meets the activation criteria, False otherwise.
         """
         try:
-            sensor = sensor_dict['sensor']
-            threshold = sensor_dict['threshold']
-            comparison = sensor_dict.get('comparison', lambda x, y: x > y)
-            data = self.calculate_average_from_last_readings(sensor)
+            if current_time is None:
+                current_time = time.time()
+            evaluation_key = (sensor, threshold, comparison)
+            window_bounds = self.window_bounds(sensor)
+            cached = self.last_evaluations.get(evaluation_key)
+            if (window_bounds is not None and cached is not None and cached[0] == window_bounds
+                    and current_time - window_bounds[1] <= AVERAGE_MAX_AGE_SECONDS):
+                self.logger.debug("No new readings for sensor %s, reusing comparison result: %s", sensor, cached[1])
+                return cached[1]
+            data = self.calculate_average_from_last_readings(sensor, current_time=current_time)
             if data is None:
+                self.last_evaluations.pop(evaluation_key, None)
                 self.logger.info(f"No average data available for sensor: {sensor}. Skipping activation check.")
                 return False
             result = comparison(data, threshold)
-            self.logger.debug(f"Sensor data: {data}, threshold: {threshold}, comparison result: {result}")
+            window_bounds = self.window_bounds(sensor)
+            if window_bounds is not None:
+                self.last_evaluations[evaluation_key] = (window_bounds, result)
+            self.logger.debug("Sensor data: %s, threshold: %s, comparison result: %s", data, threshold, result)
             if result:
                 self.logger.info(f"Sensor meets activation criteria. Triggering action. result={result} data={data} threshold={threshold}")
             else:
                 self.logger.info(f"Sensor does not meet activation criteria. result={result} data={data} threshold={threshold}")
             return result
         except Exception as ex:
-            self.logger.error(f"Error during checking sensor {sensor_dict['sensor']}: {ex}")
+            self.logger.error(f"Error during checking sensor {sensor}: {ex}")
             return False
 
-    def calculate_average_from_last_readings(self, sensor: BaseSensor, number_of_readings: int = 10,
-                                             minimum_entries: int = 5, max_age_seconds: int = 800) -> Optional[float]:
+    def window_bounds(self, sensor: BaseSensor) -> Optional[Tuple[float, float]]:
+        """
+        Returns the timestamps of the newest and the oldest reading in the rolling window of a tracked sensor.
+
+        Args:
+            sensor (BaseSensor): The sensor to look up.
+
+        Returns:
+            Optional[Tuple[float, float]]: The newest and oldest timestamps, or None if the sensor is not tracked or its window is empty.
+        """
+        with self.recent_lock:
+            window = self.recent_readings.get(sensor)
+            if not window:
+                return None
+            return window[-1][0], window[0][0]
+
+    def calculate_average_from_last_readings(self, sensor: BaseSensor, number_of_readings: int = AVERAGE_READINGS,
+                                             minimum_entries: int = AVERAGE_MINIMUM_ENTRIES, max_age_seconds: int = AVERAGE_MAX_AGE_SECONDS,
+                                             current_time: Optional[float] = None) -> Optional[float]:
         """
         Calculates the average value from the last readings of a sensor.
+        For tracked sensors with the default window size the rolling window kept by on_new_reading is used: readings older than max_age_seconds are evicted from its front and the average comes from the running sum. Otherwise the recent readings are looked up by binary search over the stored readings.
 
         Args:
             sensor (BaseSensor): The sensor from which to calculate the average.
             number_of_readings (int): Number of recent readings to consider.
             minimum_entries (int): Minimum number of entries required to calculate an average.
             max_age_seconds (int): Maximum age in seconds for readings to be considered.
+            current_time (Optional[float]): The current Unix timestamp the reading ages are measured against. Defaults to the time of the call.
 
         Returns:
             Optional[float]: The average value or None if not enough data.
         """
         try:
-            current_time = time.time()
-            all_readings = sensor.get_all_readings()
-            recent_readings = [reading for reading in all_readings if
-                               current_time - reading['timestamp'] <= max_age_seconds]
+            if current_time is None:
+                current_time = time.time()
+            if number_of_readings == AVERAGE_READINGS and sensor in self.recent_readings:
+                with self.recent_lock:
+                    window = self.recent_readings[sensor]
+                    while window and current_time - window[0][0] > max_age_seconds:
+                        self.recent_sums[sensor] -= window.popleft()[1]
+                    if not window:
+                        self.recent_sums[sensor] = 0.0
+                    count = len(window)
+                    total = self.recent_sums[sensor]
+                if count < minimum_entries:
+                    self.logger.warning(f"Not enough recent entries for sensor to perform average analysis.")
+                    return None
+                average_value = total / count
+                self.logger.debug("Calculated average value for sensor: %s", average_value)
+                return average_value
+            recent_readings = sensor.get_readings_since(current_time - max_age_seconds)
             if len(recent_readings) < minimum_entries:
                 self.logger.warning(f"Not enough recent entries for sensor to perform average analysis.")
                 return None
             last_readings = recent_readings[-number_of_readings:]
             if last_readings:
                 average_value = sum(reading['value'] for reading in last_readings) / len(last_readings)
-                self.logger.debug(f"Calculated average value for sensor: {average_value}")
+                self.logger.debug("Calculated average value for sensor: %s", average_value)
                 return average_value
             else:
                 self.logger.warning(f"Not enough entries within max age for sensor to calculate average.")
@@ -266,36 +435,64 @@ class BaseController:
     def activate_actuator(self):
         """
         Activates the actuator and handles anomaly detection for sensors.
+        Anomaly detection is re-enabled by one scheduled callback per distinct reset time rather than one per sensor, and callbacks left over from a previous activation are cancelled so they cannot re-enable it early.
         """
         if self.actuator:
             try:
-                self.last_activation = datetime.datetime.now()  # datetime
+                self.last_activation = time.monotonic()
                 self.actuator.activate()
-                self.logger.info(f"Actuator activated at {self.last_activation}.")
-                for sensor_dict in self.sensors:
-                    sensor = sensor_dict['sensor']
-                    anomaly_detection_reset_time = sensor.get_read_frequency() * 10
+                self.logger.info(f"Actuator activated at {datetime.datetime.now()}.")
+                timer_service = TimerService()
+                for handle in self.anomaly_detection_timers:
+                    timer_service.cancel(handle)
+                sensors_by_reset_time: Dict[float, List[BaseSensor]] = {}
+                for sensor, anomaly_detection_reset_time in zip(self.sensor_objects, self.anomaly_reset_times):
                     sensor.set_anomaly_detection(False)
-                    threading.Timer(anomaly_detection_reset_time, lambda: sensor.set_anomaly_detection(True)).start()
-                    self.logger.debug(f"Anomaly detection for sensor {sensor} temporarily disabled.")
+                    sensors_by_reset_time.setdefault(anomaly_detection_reset_time, []).append(sensor)
+                    self.logger.debug("Anomaly detection for sensor %s temporarily disabled.", sensor)
+                self.anomaly_detection_timers = [
+                    timer_service.schedule(reset_time, functools.partial(self.enable_anomaly_detection, tuple(sensors)))
+                    for reset_time, sensors in sensors_by_reset_time.items()
+                ]
             except Exception as ex:
                 self.logger.error(f"Failed to activate actuator: {ex}")
 
+    @staticmethod
+    def enable_anomaly_detection(sensors: Tuple[BaseSensor, ...]) -> None:
+        """
+        Re-enables anomaly detection for the given sensors once their reset time after an activation has passed.
+
+        Args:
+            sensors (Tuple[BaseSensor, ...]): The sensors to re-enable anomaly detection for.
+        """
+        for sensor in sensors:
+            sensor.set_anomaly_detection(True)
+
     def deactivate_actuator(self):
         """
-        Deactivates the actuator.
+        Deactivates the actuator. The previous evaluation result is dropped, so the next check evaluates the sensors again before the actuator can be reactivated.
         """
+        self.activation_needed = False
+        self.new_readings.set()
         if self.actuator:
             try:
-                self.last_deactivation = datetime.datetime.now()
+                self.last_deactivation = time.monotonic()
                 self.actuator.deactivate()
-                self.logger.info(f"Actuator deactivated at {self.last_deactivation}.")
+                self.logger.info(f"Actuator deactivated at {datetime.datetime.now()}.")
             except Exception as ex:
                 self.logger.error(f"Failed to deactivate actuator: {ex}")
 
     @staticmethod
-    def get_comparison(key: str):
-        if key == "HIGHER":
-            return lambda x, y: x > y
-        if key == "LOWER":
-            return lambda x, y: x < y
+    def get_comparison(key: str) -> Optional[Callable]:
+        """
+        Returns the comparison function for the given comparison name from the configuration.
+
+        Args:
+            key (str): The comparison name, either "HIGHER" or "LOWER".
+
+        Returns:
+            Optional[Callable]: The shared comparison function, or None if the name is unknown.
+        """
+        if not isinstance(key, str):
+            return None
+        return COMPARISONS.get(key)
@@ -0,0 +1,130 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from controllers.controller import BaseController
+
+class ControllerScheduler:
+    """
+    ControllerScheduler runs the checks of all started controllers from a single thread.
+    Registered controllers are kept in a heap ordered by the monotonic deadline of their next check. The scheduler thread sleeps until the nearest deadline, runs the controller's tick and schedules it again after the wait the controller asks for.
+    Implements a singleton pattern so that all controllers share the same thread.
+
+    Attributes:
+        logger (logging.Logger): Logger instance for logging messages.
+        queue (List[Tuple[float, int, BaseController]]): Heap of pending checks as (deadline, sequence number, controller) tuples.
+        controllers (Dict[BaseController, int]): Registered controllers, mapped to the sequence number of their pending heap entry.
+        counter (itertools.count): Source of sequence numbers breaking ties between equal deadlines.
+        condition (threading.Condition): Condition used to guard the heap and wake up the scheduler thread.
+        running (Optional[BaseController]): The controller whose tick is currently running, None if none is.
+        thread (Optional[threading.Thread]): The scheduler thread, None if not started.
+    """
+    _instance = None
+    _lock: threading.Lock = threading.Lock()
+
+    def __new__(cls):
+        """
+        Ensures a single instance of the ControllerScheduler class is created.
+
+        Returns:
+            ControllerScheduler: The singleton instance of the ControllerScheduler class.
+        """
+        with cls._lock:
+            if cls._instance is None:
+                instance = super(ControllerScheduler, cls).__new__(cls)
+                instance.logger = logging.getLogger('app_logger')
+                instance.queue = []
+                instance.controllers = {}
+                instance.counter = itertools.count()
+                instance.condition = threading.Condition()
+                instance.running = None
+                instance.thread = None
+                cls._instance = instance
+            return cls._instance
+
+    def register(self, controller: 'BaseController') -> bool:
+        """
+        Adds a controller to the scheduler. Its first check runs after the wait returned by its next_wait_timeout method.
+
+        Args:
+            controller (BaseController): The controller to run.
+
+        Returns:
+            bool: True if the controller was registered, False if it already was.
+        """
+        with self.condition:
+            if controller in self.controllers:
+                return False
+            self._push(controller)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, daemon=True)
+                self.thread.start()
+                self.logger.info("Controller scheduler started.")
+            self.condition.notify()
+        return True
+
+    def unregister(self, controller: 'BaseController') -> bool:
+        """
+        Removes a controller from the scheduler. If its tick is running, waits until the tick has finished, so the controller is not touched by the scheduler after this returns.
+
+        Args:
+            controller (BaseController): The controller to remove.
+
+        Returns:
+            bool: True if the controller was registered, False otherwise.
+        """
+        with self.condition:
+            if controller not in self.controllers:
+                return False
+            del self.controllers[controller]
+            if threading.current_thread() is not self.thread:
+                while self.running is controller:
+                    self.condition.wait()
+        return True
+
+    def _push(self, controller: 'BaseController') -> None:
+        """
+        Adds the next check of a controller to the heap and records it as the controller's pending entry. Must be called with the condition held.
+
+        Args:
+            controller (BaseController): The controller to check.
+        """
+        sequence = next(self.counter)
+        self.controllers[controller] = sequence
+        heapq.heappush(self.queue, (time.monotonic() + controller.next_wait_timeout(), sequence, controller))
+
+    def _run(self) -> None:
+        """
+        The scheduler loop that waits until the nearest deadline and runs the tick of the controller that is due.
+        Entries left in the heap by unregistered controllers are dropped when they come up.
+        """
+        while True:
+            with self.condition:
+                while True:
+                    if not self.queue:
+                        self.condition.wait()
+                        continue
+                    deadline, sequence, controller = self.queue[0]
+                    if self.controllers.get(controller) != sequence:
+                        heapq.heappop(self.queue)
+                        continue
+                    remaining = deadline - time.monotonic()
+                    if remaining > 0:
+                        self.condition.wait(remaining)
+                        continue
+                    heapq.heappop(self.queue)
+                    break
+                self.running = controller
+            try:
+                controller.tick()
+            except Exception as ex:
+                self.logger.error(f"Error during controller {controller} check: {ex}")
+            with self.condition:
+                self.running = None
+                if controller in self.controllers:
+                    self._push(controller)
+                self.condition.notify_all()
@@ -1,45 +1,145 @@
+import atexit
+import functools
 import logging
+import queue
+import random
+import threading
 from influxdb import InfluxDBClient, exceptions
-from typing import Dict
+from typing import Any, Dict, List, Tuple
 from app_config import APP_CONFIG_PATH, AppConfig
 import time
 
+WRITE_BATCH_SIZE = 500
+WRITE_FLUSH_INTERVAL = 5
+RETRY_BASE_INTERVAL = 1.0
+RETRY_MAX_INTERVAL = 300
+MAX_RETRIES = 10
+
+@functools.lru_cache(maxsize=128)
+def line_protocol_prefix(measurement: str, tags: Tuple[Tuple[str, str], ...]) -> str:
+    """
+    Builds the escaped line protocol prefix, measurement and tag set, shared by every point written with the same measurement and tags.
+
+    Args:
+        measurement (str): The measurement name.
+        tags (Tuple[Tuple[str, str], ...]): Tag names and values sorted by tag name.
+
+    Returns:
+        str: The prefix including the trailing space that separates it from the field set.
+    """
+    prefix = measurement.replace(',', '\\,').replace(' ', '\\ ')
+    for key, value in tags:
+        if value == '' or value is None:
+            continue
+        prefix += f",{escape_tag(key)}={escape_tag(str(value))}"
+    return prefix + ' '
+
+def escape_tag(value: str) -> str:
+    """
+    Escapes a tag key or value for the line protocol.
+
+    Args:
+        value (str): The tag key or value.
+
+    Returns:
+        str: The escaped text.
+    """
+    return value.replace(',', '\\,').replace('=', '\\=').replace(' ', '\\ ')
+
+def format_field(value: Any) -> str:
+    """
+    Formats a field value for the line protocol, keeping the types the JSON writer would produce so existing series do not change type.
+
+    Args:
+        value (Any): The field value.
+
+    Returns:
+        str: The formatted value.
+    """
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int):
+        return f"{value}i"
+    if isinstance(value, float):
+        return repr(value)
+    return '"' + str(value).replace('\\', '\\\\').replace('"', '\\"') + '"'
+
 class InfluxDBManager:
     """
     Manages connections and data operations with an InfluxDB database instance.
     Implements a singleton pattern to ensure only one connection exists throughout the application.
     Handles reconnection attempts if the initial connection fails or if the connection is lost.
+    Single points passed to write_data are buffered and written in batches by a background thread, every WRITE_FLUSH_INTERVAL seconds or as soon as WRITE_BATCH_SIZE points are waiting.
 
     Attributes:
         client (InfluxDBClient): Client instance for connecting to an InfluxDB database.
         logger (logging.Logger): Logger instance for logging messages.
+        influx_config (Dict[str, Any]): The 'influxdb' section of the application configuration, read once and reused by every reconnection attempt.
+        queue (queue.Queue): Points waiting to be written by the flush thread.
+        flush_event (threading.Event): Event that wakes up the flush thread before the flush interval elapses.
+        flush_thread (threading.Thread): Background thread writing the buffered points. It also opens the initial connection.
+        connect_lock (threading.Lock): Lock held while a connection attempt is running, so concurrent writers do not open connections of their own.
     """
     _instance = None
+    _lock: threading.Lock = threading.Lock()
+    _shutdown_event: threading.Event = threading.Event()
 
     def __new__(cls):
         """
-        Ensures a single instance of the InfluxDBManager class is created. Initializes the connection to the InfluxDB database using configuration from the application's config file.
+        Ensures a single instance of the InfluxDBManager class is created, using configuration from the application's config file.
+        Creation runs under a class-level lock, so threads constructing the manager concurrently at startup share a single instance. The lock only covers setting up the queue and the flush thread: the connection is opened by the flush thread, so constructing the manager never waits for an unreachable database. Points written before the connection is up stay queued.
 
         Returns:
             InfluxDBManager: The singleton instance of the InfluxDBManager class.
         """
+        with cls._lock:
+            if cls._instance is None:
+                instance = super(InfluxDBManager, cls).__new__(cls)
+                instance.logger = logging.getLogger('app_logger')
+                instance.client = None
+                instance.influx_config = {}
+                instance.queue = queue.Queue()
+                instance.flush_event = threading.Event()
+                instance.connect_lock = threading.Lock()
+                cls._instance = instance
+                cls.reload_config()
+                instance.flush_thread = threading.Thread(target=instance._flush_loop, daemon=True)
+                instance.flush_thread.start()
+                atexit.register(instance.flush)
+            return cls._instance
+
+    @classmethod
+    def reload_config(cls):
+        """
+        Reads the InfluxDB section of the application configuration again. Takes effect on the next connection attempt. Does nothing if the manager has not been created yet, as creating it reads the configuration.
+        """
         if cls._instance is None:
-            cls._instance = super(InfluxDBManager, cls).__new__(cls)
-            cls._instance.logger = logging.getLogger('app_logger')
-            cls._instance.client = None
-            cls._initialize_connection()
-        return cls._instance
+            return
+        cls._instance.influx_config = AppConfig(APP_CONFIG_PATH).get_config().get('influxdb', {})
 
     @classmethod
     def _initialize_connection(cls):
         """
-        Initializes the connection to the InfluxDB database using the configuration specified in the application's configuration file. Attempts to reconnect if the initial connection fails, with a defined number of retries and interval between retries.
+        Initializes the connection to the InfluxDB database using the configuration specified in the application's configuration file. Attempts to reconnect if the initial connection fails, with a defined number of retries.
+        The interval between retries grows exponentially from RETRY_BASE_INTERVAL up to RETRY_MAX_INTERVAL and is randomized by +/-50%, so short outages recover quickly and restarted processes do not retry in lockstep.
+        Retrying stops early when the credentials are rejected or when shutdown has been called.
+        If another thread is already connecting, returns right away without waiting for it.
+        """
+        if not cls._instance.connect_lock.acquire(blocking=False):
+            return
+        try:
+            cls._connect()
+        finally:
+            cls._instance.connect_lock.release()
+
+    @classmethod
+    def _connect(cls):
+        """
+        Runs the connection attempts of _initialize_connection. Must be called with connect_lock held.
         """
-        app_config = AppConfig(APP_CONFIG_PATH).get_config()
-        influx_config = app_config.get('influxdb', {})
+        influx_config = cls._instance.influx_config
         required_keys = ['host', 'port', 'username', 'password', 'database']
-        retry_interval = 60
-        max_retries = 10
+        max_retries = MAX_RETRIES
         retries = 0
 
         if not all(key in influx_config for key in required_keys):
@@ -49,43 +149,104 @@ class InfluxDBManager:
 
         while retries < max_retries:
             try:
-                cls._instance.client = InfluxDBClient(
+                client = InfluxDBClient(
                     host=influx_config.get('host', 'localhost'),
                     port=influx_config.get('port', 8086),
                     username=influx_config.get('username', ''),
                     password=influx_config.get('password', ''),
                     database=influx_config.get('database', 'garden')
                 )
-                cls._instance.client.ping()
+                client.ping()
+                cls._instance.client = client
                 cls._instance.logger.info("Successfully connected to InfluxDB.")
                 return
-            except (KeyError, exceptions.InfluxDBClientError, Exception) as ex:
+            except exceptions.InfluxDBClientError as ex:
+                if ex.code in (401, 403):
+                    cls._instance.logger.error(f"InfluxDB rejected the credentials, not retrying: {ex}")
+                    break
                 cls._instance.logger.error(f"Failed to connect to InfluxDB, attempt {retries + 1} of {max_retries}: {ex}")
-                time.sleep(retry_interval)
-                retries += 1
-
-        cls._instance.logger.error("Exceeded maximum number of retries to connect to InfluxDB. Data write operations will be skipped.")
+            except Exception as ex:
+                cls._instance.logger.error(f"Failed to connect to InfluxDB, attempt {retries + 1} of {max_retries}: {ex}")
+            if cls._shutdown_event.wait(min(RETRY_MAX_INTERVAL, RETRY_BASE_INTERVAL * 2 ** retries) * (0.5 + random.random())):
+                cls._instance.logger.info("Shutdown requested, giving up connecting to InfluxDB.")
+                cls._instance.client = None
+                return
+            retries += 1
+        else:
+            cls._instance.logger.error("Exceeded maximum number of retries to connect to InfluxDB. Data write operations will be skipped.")
         cls._instance.client = None
 
+    @classmethod
+    def shutdown(cls):
+        """
+        Signals application teardown. A reconnection loop waiting between attempts returns immediately and later connection failures are not retried, so stopping the application is not held up by an unreachable database.
+        """
+        cls._shutdown_event.set()
+
     def write_data(self, measurement: str, fields: Dict[str, float], tags: Dict[str, str]):
         """
-        Writes a single data point to the InfluxDB database. If the InfluxDB client is not initialized, it attempts to reinitialize the connection before writing.
+        Queues a single data point for writing to the InfluxDB database. The point is timestamped now and written with the next batch by the flush thread.
+        The point is serialized to line protocol right away, reusing a cached prefix for the measurement and tags, so the batch is sent without building and converting JSON points.
 
         Args:
             measurement (str): The measurement name to which the data point belongs.
             fields (Dict[str, float]): A dictionary of field names and their values for the data point.
             tags (Dict[str, str]): A dictionary of tag names and their values associated with the data point.
         """
+        prefix = line_protocol_prefix(measurement, tuple(sorted(tags.items())))
+        field_set = ",".join(f"{escape_tag(key)}={format_field(value)}" for key, value in fields.items())
+        self.queue.put(f"{prefix}{field_set} {time.time_ns()}")
+        if self.queue.qsize() >= WRITE_BATCH_SIZE:
+            self.flush_event.set()
+
+    def flush(self):
+        """
+        Writes all queued data points to the InfluxDB database in a single request.
+        """
+        lines = []
+        try:
+            while True:
+                lines.append(self.queue.get_nowait())
+        except queue.Empty:
+            pass
+        self.write_points(lines, protocol='line')
+
+    def _flush_loop(self):
+        """
+        Background loop writing the queued data points every WRITE_FLUSH_INTERVAL seconds, or earlier when woken up because a full batch is waiting.
+        Opens the initial connection before the first flush.
+        """
+        try:
+            self._initialize_connection()
+        except Exception as ex:
+            self.logger.error(f"Unexpected error occurred while connecting to InfluxDB: {ex}")
+        while True:
+            self.flush_event.wait(WRITE_FLUSH_INTERVAL)
+            self.flush_event.clear()
+            try:
+                self.flush()
+            except Exception as ex:
+                self.logger.error(f"Unexpected error occurred while flushing data to InfluxDB: {ex}")
+
+    def write_points(self, points: List[Any], protocol: str = 'json'):
+        """
+        Writes a batch of data points to the InfluxDB database in a single request. If the InfluxDB client is not initialized, it attempts to reinitialize the connection before writing.
+
+        Args:
+            points (List[Any]): Data points in the InfluxDB JSON format, each with 'measurement', 'tags' and 'fields' keys, or line protocol strings when protocol is 'line'.
+            protocol (str): The format of the points, 'json' or 'line'. Defaults to 'json'.
+        """
+        if not points:
+            return
         if not self.client:
             self.logger.warning("InfluxDB client is not initialized. Attempting to reconnect.")
             self._initialize_connection()
             if not self.client:
                 self.logger.error("Reconnection to InfluxDB failed. Data write aborted.")
                 return
-        json_body = [{"measurement": measurement, "tags": tags, "fields": fields}]
         try:
-            self.client.write_points(json_body)
-            self.logger.info(f"Data written to InfluxDB: {json_body}")
+            self.client.write_points(points, protocol=protocol)
+            self.logger.info("Wrote %s points to InfluxDB", len(points))
         except exceptions.InfluxDBServerError as ex:
             self.logger.error(f"InfluxDB server error, failed to write data: {ex}")
         except exceptions.InfluxDBClientError as ex:
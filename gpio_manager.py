@@ -0,0 +1,64 @@
+import logging
+import threading
+from typing import Set
+import RPi.GPIO as GPIO
+
+class GPIOManager:
+    """
+    Keeps the process-wide RPi.GPIO state in one place: the numbering mode is configured once, and the pins set up by the application are recorded so that only they are cleaned up on exit.
+
+    Class Attributes:
+        _mode_initialized (bool): Whether the GPIO warnings and BCM numbering mode have been configured in this process.
+        _pins (Set[int]): GPIO pins set up by the application and not released yet.
+        _lock (threading.Lock): A class-wide lock guarding the mode initialization and the pin set.
+    """
+    _mode_initialized: bool = False
+    _pins: Set[int] = set()
+    _lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def ensure_mode(cls) -> None:
+        """
+        Configures the GPIO warnings and BCM numbering mode once per process, no matter how many sensors and actuators set up pins.
+        """
+        with cls._lock:
+            if not cls._mode_initialized:
+                GPIO.setwarnings(False)
+                GPIO.setmode(GPIO.BCM)
+                cls._mode_initialized = True
+
+    @classmethod
+    def claim(cls, pin: int) -> None:
+        """
+        Records a pin set up by the application so it is cleaned up by cleanup.
+
+        Args:
+            pin (int): The GPIO pin number.
+        """
+        with cls._lock:
+            cls._pins.add(pin)
+
+    @classmethod
+    def release(cls, pin: int) -> None:
+        """
+        Forgets a pin that has already been cleaned up by its owner.
+
+        Args:
+            pin (int): The GPIO pin number.
+        """
+        with cls._lock:
+            cls._pins.discard(pin)
+
+    @classmethod
+    def cleanup(cls) -> None:
+        """
+        Cleans up the pins used by the application, leaving other pins of the board untouched.
+        """
+        with cls._lock:
+            pins = sorted(cls._pins)
+            cls._pins.clear()
+        if pins:
+            try:
+                GPIO.cleanup(pins)
+            except Exception as ex:
+                logging.getLogger('app_logger').error(f"Error during cleanup of GPIO pins {pins}: {ex}")
@@ -1,27 +1,40 @@
+import atexit
 import logging
+import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, SysLogHandler
+from typing import Dict, Optional
+
+SYSLOG_ADDRESS = '/dev/log'
 
 class LoggerManager:
     """
-    LoggerManager is responsible for setting up and configuring loggers in the application. It uses the Python logging module to create loggers that write to both the console and a rotating file.
+    LoggerManager is responsible for setting up and configuring loggers in the application. It uses the Python logging module to create loggers that write to both the console and a rotating file, or syslog.
+    Records are handed to the handlers by a QueueListener thread, so the threads that log only put the record on a queue and never wait for console or disk I/O.
+
+    Class Attributes:
+        listeners (Dict[str, QueueListener]): Running queue listeners, keyed by logger name.
 
     Static Methods:
         setup_logger: Configures and returns a logger with the specified name and settings.
     """
+    listeners: Dict[str, QueueListener] = {}
 
     @staticmethod
-    def setup_logger(log_name: str, log_file: str, level_console: Optional[int] = logging.INFO, level_file: Optional[int] = logging.DEBUG) -> logging.Logger:
+    def setup_logger(log_name: str, log_file: str, level_console: Optional[int] = logging.INFO, level_file: Optional[int] = logging.DEBUG, use_syslog: bool = False) -> logging.Logger:
         """
         Sets up a logger with given configurations.
         This method configures a logger to write logs to a rotating file and the console. It ensures that multiple handlers are not added to the same logger.
+        The log file is only opened when the first record is written. The records do not carry the source file and line: without them logging skips the stack walk that finds the caller of every record.
+        With use_syslog, records are sent to the local syslog daemon instead of the log file, leaving buffering and rotation to the system. If the syslog socket does not exist, the rotating file is used.
 
         Args:
             log_name (str): The name of the logger.
             log_file (str): The path to the log file.
             level_console (Optional[int]): The logging level for the console handler. Defaults to logging.INFO.
-            level_file (Optional[int]): The logging level for the file handler. Defaults to logging.DEBUG.
+            level_file (Optional[int]): The logging level for the file or syslog handler. Defaults to logging.DEBUG.
+            use_syslog (bool): Whether to log to syslog instead of the log file. Defaults to False.
 
         Returns:
             logging.Logger: Configured logger instance.
@@ -29,17 +42,30 @@ class LoggerManager:
         try:
             logger = logging.getLogger(log_name)
             if not logger.handlers:
+                logging._srcfile = None
+                logging.logProcesses = False
+                logging.logMultiprocessing = False
                 logger.setLevel(logging.DEBUG)
-                file_handler = RotatingFileHandler(log_file, maxBytes=25000000, backupCount=10, encoding='utf-8')
-                file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - (%(filename)s:%(lineno)d) - %(message)s')
+                if use_syslog and os.path.exists(SYSLOG_ADDRESS):
+                    file_handler = SysLogHandler(address=SYSLOG_ADDRESS, facility=SysLogHandler.LOG_LOCAL0)
+                    file_formatter = logging.Formatter('%(name)s - %(levelname)s - %(message)s')
+                else:
+                    file_handler = RotatingFileHandler(log_file, maxBytes=25000000, backupCount=10, encoding='utf-8', delay=True)
+                    file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
                 file_handler.setFormatter(file_formatter)
                 file_handler.setLevel(level_file)
                 console_handler = logging.StreamHandler(sys.stdout)
                 console_formatter = logging.Formatter('%(asctime)s %(levelname)s: %(message)s')
                 console_handler.setFormatter(console_formatter)
                 console_handler.setLevel(level_console)
-                logger.addHandler(file_handler)
-                logger.addHandler(console_handler)
+                log_queue = queue.SimpleQueue()
+                listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+                listener.start()
+                atexit.register(listener.stop)
+                LoggerManager.listeners[log_name] = listener
+                queue_handler = QueueHandler(log_queue)
+                queue_handler.setLevel(min(level_file, level_console))
+                logger.addHandler(queue_handler)
             return logger
         except Exception as ex:
             print(f"Error setting up logger {log_name}: {ex}")
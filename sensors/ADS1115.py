@@ -1,10 +1,32 @@
 import threading
-from typing import Dict, Optional, Type, Tuple
-import board
-import busio
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Type, Tuple
 from adafruit_ads1x15.analog_in import AnalogIn
 import adafruit_ads1x15.ads1115 as ADS1115
 import logging
+from sensors.i2c_bus import get_i2c_bus
+
+CHANNELS = (ADS1115.P0, ADS1115.P1, ADS1115.P2, ADS1115.P3)
+PGA_RANGE: Dict[float, float] = {2 / 3: 6.144, 1: 4.096, 2: 2.048, 4: 1.024, 8: 0.512, 16: 0.256}
+FULL_SCALE_COUNT = 32767
+ADS1115_MAX_AGE = 0.1
+
+@dataclass(slots=True)
+class ADS1115Device:
+    """
+    An ADS1115 ADC converter shared by all channel converters on the same I2C address.
+
+    Attributes:
+        ads (ADS1115.ADS1115): The converter driver.
+        inputs (List[AnalogIn]): Single-ended inputs of the converter, one per channel.
+        volts_per_count (float): Voltage of one count of a raw reading at the converter's gain, computed once so readings are scaled with a single multiplication.
+        lock (threading.Lock): Lock serializing conversions, so reads of different channels from different threads do not interleave their multiplexer configuration.
+    """
+    ads: ADS1115.ADS1115
+    inputs: List[AnalogIn]
+    volts_per_count: float
+    lock: threading.Lock = field(default_factory=threading.Lock)
 
 class ADS1115Converter:
     """
@@ -15,60 +37,139 @@ class ADS1115Converter:
         i2c_address (int): The I2C address of the ADS1115 ADC converter.
         channel (int): The channel of the ADS1115 ADC converter to read from.
         last_read (float | None): The last read analog value or None if no successful read.
+        last_read_time (float): The time.monotonic() value of the last successful read.
+        max_age (float): Time in seconds for which the last successful read is returned instead of reading the converter again.
+        device (ADS1115Device): The converter shared with the other channels on the same I2C address.
+        analog_input (AnalogIn): The input of the channel on the shared converter.
         logger (logging.Logger): Logger instance for logging operation messages.
 
     Class Attributes:
         _instances (dict): A dictionary holding instances of ADS1115Converter, keyed by a tuple of I2C address and channel.
+        _devices (dict): A dictionary holding the shared ADS1115Device of each I2C address.
         _lock (threading.Lock): A class-wide lock to ensure thread-safe instantiation.
+        _devices_lock (threading.Lock): A class-wide lock to ensure thread-safe creation of the shared devices.
 
     Args:
         i2c_address (int, optional): The I2C address of the ADS1115 ADC converter. Defaults to 0x48.
         channel (int): The channel to read from (0-3).
+        max_age (float, optional): Time in seconds a successful read is reused. Defaults to ADS1115_MAX_AGE.
     """
     _instances: Dict[Tuple[int, int], 'ADS1115Converter'] = {}
+    _devices: Dict[int, ADS1115Device] = {}
     _lock: threading.Lock = threading.Lock()
+    _devices_lock: threading.Lock = threading.Lock()
+    __slots__ = ('logger', 'i2c_address', 'channel', 'last_read', 'last_read_time', 'max_age', 'device', 'analog_input')
+
+    def __new__(cls: Type['ADS1115Converter'], i2c_address: int = 0x48, channel: int = 0, max_age: float = ADS1115_MAX_AGE) -> 'ADS1115Converter':
+        """
+        Ensures that only one instance of ADS1115Converter per I2C address and channel is created and initializes it once, so constructing the converter again does not set up the ADC again.
+
+        Args:
+            i2c_address (int, optional): The I2C address of the ADS1115 ADC converter. Defaults to 0x48.
+            channel (int): The channel to read from (0-3).
+            max_age (float, optional): Time in seconds a successful read is reused. Only used when the instance is first created.
 
-    def __new__(cls: Type['ADS1115Converter'], i2c_address: int = 0x48, channel: int = 0) -> 'ADS1115Converter':
+        Returns:
+            ADS1115Converter: An instance of the ADS1115Converter class for the specified I2C address and channel.
+        """
         key = (i2c_address, channel)
+        instance = cls._instances.get(key)
+        if instance is not None:
+            return instance
         with cls._lock:
             if key not in cls._instances:
                 instance = super(ADS1115Converter, cls).__new__(cls)
+                instance.logger = logging.getLogger('app_logger')
+                instance.i2c_address = i2c_address
+                instance.channel = channel
+                instance.last_read = None
+                instance.last_read_time = 0.0
+                instance.max_age = max_age
+                instance._initialize_adc(i2c_address, channel)
                 cls._instances[key] = instance
             return cls._instances[key]
 
-    def __init__(self, i2c_address: int = 0x48, channel: int = 0) -> None:
-        self.logger = logging.getLogger('app_logger')
-        self.i2c_address = i2c_address
-        self.channel = channel
-        self.last_read = None
-        self._initialize_adc(i2c_address, channel)
-
     def _initialize_adc(self, i2c_address: int, channel: int) -> None:
         """
         Initializes the ADS1115 ADC converter with the specified I2C address and channel.
         """
         try:
-            i2c = busio.I2C(board.SCL, board.SDA)
-            ads = ADS1115.ADS1115(i2c, address=i2c_address)
-            channels = [ADS1115.P0, ADS1115.P1, ADS1115.P2, ADS1115.P3]
             if channel < 0 or channel > 3:
                 raise ValueError("Channel must be between 0 and 3")
-            self.analog_input = AnalogIn(ads, channels[channel])
-            self.logger.info(f"ADS1115 ADC converter on I2C address {i2c_address}, channel {channel} configured.")
+            self.device = self.get_device(i2c_address)
+            self.analog_input = self.device.inputs[channel]
+            self.logger.info("ADS1115 ADC converter on I2C address %s, channel %s configured.", i2c_address, channel)
         except Exception as ex:
             self.logger.error(f"Problem when initializing the ADC: {ex}")
 
-    def read(self) -> Optional[float]:
+    @classmethod
+    def get_device(cls, i2c_address: int) -> ADS1115Device:
+        """
+        Returns the ADS1115 converter on the given I2C address, creating it on first use, so the channels of one converter share the I2C bus object and driver.
+
+        Args:
+            i2c_address (int): The I2C address of the ADS1115 ADC converter.
+
+        Returns:
+            ADS1115Device: The shared converter.
+        """
+        with cls._devices_lock:
+            device = cls._devices.get(i2c_address)
+            if device is None:
+                i2c = get_i2c_bus()
+                ads = ADS1115.ADS1115(i2c, address=i2c_address)
+                device = ADS1115Device(ads, [AnalogIn(ads, pin) for pin in CHANNELS], PGA_RANGE[ads.gain] / FULL_SCALE_COUNT)
+                cls._devices[i2c_address] = device
+            return device
+
+    @classmethod
+    def read_all(cls, i2c_address: int = 0x48) -> List[Optional[float]]:
+        """
+        Reads all four single-ended channels of the ADS1115 ADC converter back to back, holding the converter for the whole sequence.
+
+        Args:
+            i2c_address (int, optional): The I2C address of the ADS1115 ADC converter. Defaults to 0x48.
+
+        Returns:
+            List[Optional[float]]: The readings in volts indexed by channel, None for a channel whose read failed.
+        """
+        logger = logging.getLogger('app_logger')
+        voltages: List[Optional[float]] = []
+        try:
+            device = cls.get_device(i2c_address)
+        except Exception as ex:
+            logger.error(f"Error reading ADS1115 on I2C address {i2c_address}: {ex}")
+            return [None] * len(CHANNELS)
+        with device.lock:
+            for channel, analog_input in enumerate(device.inputs):
+                try:
+                    voltages.append(analog_input.value * device.volts_per_count)
+                except Exception as ex:
+                    logger.error(f"Error reading ADS1115 on I2C address {i2c_address}, channel {channel}: {ex}")
+                    voltages.append(None)
+        logger.info("ADS1115 on I2C address %s read %s V", i2c_address, voltages)
+        return voltages
+
+    def read(self, force_refresh: bool = False) -> Optional[float]:
         """
         Performs a read operation on the ADS1115 ADC converter to get the current analog value.
+        A successful read younger than max_age is returned without another conversion, so callers reading the same channel at the same moment share one I2C transaction.
+        The raw reading is scaled with the device's precomputed volts_per_count instead of the AnalogIn.voltage property, which looks up the gain and its range on every read.
+
+        Args:
+            force_refresh (bool): Read the converter even if the last successful read is still fresh. Defaults to False.
 
         Returns:
             Optional[float]: The current analog reading in volts, or None if the read fails.
         """
+        if not force_refresh and self.last_read is not None and time.monotonic() - self.last_read_time < self.max_age:
+            return self.last_read
         try:
-            voltage = self.analog_input.voltage
+            with self.device.lock:
+                voltage = self.analog_input.value * self.device.volts_per_count
             self.last_read = voltage
-            self.logger.info(f"ADS1115 on I2C address {self.i2c_address}, channel {self.channel} read {voltage} V")
+            self.last_read_time = time.monotonic()
+            self.logger.info("ADS1115 on I2C address %s, channel %s read %s V", self.i2c_address, self.channel, voltage)
             return voltage
         except Exception as ex:
             self.logger.error(f"Error reading ADS1115 on I2C address {self.i2c_address}, channel {self.channel}: {ex}")
@@ -82,8 +183,9 @@ class ADS1115Converter:
             Optional[int]: The current raw analog reading, or None if the read fails.
         """
         try:
-            raw_value = self.analog_input.value
-            self.logger.info(f"ADS1115 on I2C address {self.i2c_address}, channel {self.channel} read raw value {raw_value}")
+            with self.device.lock:
+                raw_value = self.analog_input.value
+            self.logger.info("ADS1115 on I2C address %s, channel %s read raw value %s", self.i2c_address, self.channel, raw_value)
             return raw_value
         except Exception as ex:
             self.logger.error(f"Error reading raw value from ADS1115 on I2C address {self.i2c_address}, channel {self.channel}: {ex}")
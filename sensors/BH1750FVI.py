@@ -1,9 +1,12 @@
 import threading
+import time
 from typing import Optional, Type, Dict
-import board
-import busio
 from adafruit_bh1750 import BH1750
 import logging
+from sensors.i2c_bus import get_i2c_bus
+
+BH1750_MAX_AGE = 0.2
+LUX_PER_COUNT = 1 / 1.2
 
 class BH1750Sensor:
     """
@@ -11,7 +14,12 @@ class BH1750Sensor:
 
     Attributes:
         i2c_address (int): The I2C address of the BH1750 sensor.
-        last_read (dict | None): The last read light intensity value or None if no successful read.
+        read_value (Optional[float]): The last read light intensity value in lux or None if no successful read.
+        last_read_time (float): The time.monotonic() value of the last successful read.
+        max_age (float): Time in seconds for which the last successful read is returned instead of reading the sensor again.
+        i2c (busio.I2C): The shared I2C bus.
+        sensor (BH1750): The Adafruit driver, used to configure the measurement mode.
+        buffer (bytearray): Buffer the 16-bit measurement is read into.
         logger (logging.Logger): Logger instance for logging sensor operation messages.
 
     Class Attributes:
@@ -20,52 +28,73 @@ class BH1750Sensor:
 
     Args:
         i2c_address (int): The I2C address where the sensor is connected.
+        max_age (float, optional): Time in seconds a successful read is reused. Defaults to BH1750_MAX_AGE, the measurement time of the high resolution mode.
     """
     _instances: Dict[int, 'BH1750Sensor'] = {}
     _lock: threading.Lock = threading.Lock()
+    __slots__ = ('i2c_address', 'read_value', 'last_read_time', 'max_age', 'logger', 'i2c', 'sensor', 'buffer')
 
     i2c_address: int
-    read: Optional[float] = None
+    read_value: Optional[float]
+    last_read_time: float
+    max_age: float
     logger: logging.Logger
 
-    def __new__(cls: Type['BH1750Sensor'], i2c_address: int = 0x23) -> 'BH1750Sensor':
+    def __new__(cls: Type['BH1750Sensor'], i2c_address: int = 0x23, max_age: float = BH1750_MAX_AGE) -> 'BH1750Sensor':
         """
-        Ensures that only one instance of BH1750Sensor per I2C address is created. If an instance for a given address already exists, it returns that instance; otherwise, it creates a new one.
+        Ensures that only one instance of BH1750Sensor per I2C address is created. If an instance for a given address already exists, it returns that instance without taking the class lock; otherwise, it creates a new one under the lock.
+        The I2C bus and the BH1750 driver are set up here, once per address, so constructing the sensor again does not reopen the I2C device or reconfigure the sensor.
 
         Args:
             i2c_address (int, optional): The I2C address of the BH1750 sensor. Defaults to 0x23.
+            max_age (float, optional): Time in seconds a successful read is reused. Only used when the instance is first created.
 
         Returns:
             BH1750Sensor: An instance of the BH1750Sensor class for the specified I2C address.
         """
+        instance = cls._instances.get(i2c_address)
+        if instance is not None:
+            return instance
         with cls._lock:
             if i2c_address not in cls._instances:
                 instance = super(BH1750Sensor, cls).__new__(cls)
                 instance.i2c_address = i2c_address
-                instance.read = None
+                instance.read_value = None
+                instance.last_read_time = 0.0
+                instance.max_age = max_age
                 instance.logger = logging.getLogger('app_logger')
+                instance.i2c = get_i2c_bus()
+                instance.sensor = BH1750(instance.i2c, address=i2c_address)
+                instance.buffer = bytearray(2)
+                instance.logger.info("BH1750FVI light sensor on I2C address %s configured.", i2c_address)
                 cls._instances[i2c_address] = instance
             return cls._instances[i2c_address]
 
-    def __init__(self, i2c_address: int = 0x23) -> None:
-        """
-        Initializes the BH1750 sensor with the specified I2C address.
-        """
-        self.i2c = busio.I2C(board.SCL, board.SDA)
-        self.sensor = BH1750(self.i2c, address=i2c_address)
-        self.logger.info(f"BH1750FVI light sensor on I2C address {i2c_address} configured.")
-
-    def read_sensor_value(self) -> Optional[float]:
+    def read_sensor_value(self, force_refresh: bool = False) -> Optional[float]:
         """
         Performs a read operation on the BH1750 sensor to get the current light intensity value.
+        A successful read younger than max_age is returned without another I2C transaction.
+        The driver leaves the sensor in continuous high resolution mode with the default measurement time, so the last measurement is read directly as a 16-bit word into a reused buffer and converted with LUX_PER_COUNT, bypassing the driver's lux property.
+
+        Args:
+            force_refresh (bool): Read the sensor even if the last successful read is still fresh. Defaults to False.
 
         Returns:
             Optional[float]: The current light intensity reading in lux, or None if the read fails.
         """
+        if not force_refresh and self.read_value is not None and time.monotonic() - self.last_read_time < self.max_age:
+            return self.read_value
         try:
-            light_intensity = self.sensor.lux
+            while not self.i2c.try_lock():
+                time.sleep(0)
+            try:
+                self.i2c.readfrom_into(self.i2c_address, self.buffer)
+            finally:
+                self.i2c.unlock()
+            light_intensity = ((self.buffer[0] << 8) | self.buffer[1]) * LUX_PER_COUNT
             self.read_value = light_intensity
-            self.logger.info(f"BH1750 on I2C address {self.i2c_address} read {self.read_value} lux")
+            self.last_read_time = time.monotonic()
+            self.logger.info("BH1750 on I2C address %s read %s lux", self.i2c_address, self.read_value)
             return self.read_value
         except Exception as ex:
             self.logger.error(f"Error reading BH1750 sensor on I2C address {self.i2c_address}: {ex}")
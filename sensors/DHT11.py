@@ -1,8 +1,16 @@
-from typing import Dict, Optional, Type
+from typing import Dict, Optional, Tuple, Type
 import Adafruit_DHT
 import threading
+import time
 import RPi.GPIO as GPIO
 import logging
+from gpio_manager import GPIOManager
+from sensors.dht11_pigpio import PigpioDHT11Reader
+
+DHT11_MAX_AGE = 2.0
+DHT11_READ_ATTEMPTS = 3
+DHT11_RETRY_DELAY = 0.05
+DHT11_SNAPSHOT_MAX_POLLS = 3
 
 class DHT11Sensor:
     """
@@ -14,74 +22,189 @@ class DHT11Sensor:
         sensor_type (Adafruit_DHT.DHT11): The type of DHT sensor
         pin (int): The GPIO pin number that the sensor is connected to.
         last_read (dict | None): The last read humidity and temperature values or None if no successful read.
+        last_read_time (float): The time.monotonic() value of the last successful read.
+        last_attempt_time (float): The time.monotonic() value at which the last read of the sensor finished, successful or not.
+        max_age (float): Time in seconds for which the last successful read is returned instead of reading the sensor again.
+        read_lock (threading.Lock): Lock serializing reads of the sensor, so callers sharing the pin wait for a read in progress and get its result.
+        poll_interval (Optional[float]): Interval in seconds of the background polling thread, None if the sensor is read on demand.
+        snapshot (Optional[Tuple[float, float, float]]): The last humidity, temperature and time.monotonic() value read by the polling thread, replaced with a single assignment.
+        poll_thread (Optional[threading.Thread]): The background polling thread, None if not started.
+        pigpio_reader (Optional[PigpioDHT11Reader]): Reader decoding the sensor through the pigpio daemon, None if pigpio is not available and Adafruit_DHT is used.
+        poll_stop_event (threading.Event): Event that wakes up and stops the polling thread.
         logger (logging.Logger): Logger instance for logging sensor operation messages.
 
     Class Attributes:
-        _instances (dict): A dictionary holding instances of DHTSensorSingleton, keyed by GPIO pin numbers.
+        _instances (dict): A dictionary holding instances of DHT11Sensor, keyed by GPIO pin numbers.
         _lock (threading.Lock): A class-wide lock to ensure thread-safe singleton instantiation.
 
     Args:
         pin (int): The GPIO pin number where the sensor is connected.
         sensor_type (Adafruit_DHT.DHT11, optional): The type of DHT sensor. Defaults to Adafruit_DHT.DHT11.
+        max_age (float, optional): Time in seconds a successful read is reused. Defaults to DHT11_MAX_AGE, the shortest sampling period of the DHT11.
+        poll_interval (Optional[float], optional): If given, the sensor is read by a background thread at this interval and reads return the latest snapshot without blocking. Defaults to None.
     """
     _instances: Dict[int, 'DHT11Sensor'] = {}
     _lock: threading.Lock = threading.Lock()
+    __slots__ = ('sensor_type', 'pin', 'last_read', 'last_read_time', 'last_attempt_time', 'max_age', 'read_lock', 'poll_interval', 'snapshot', 'poll_thread', 'pigpio_reader', 'poll_stop_event', 'logger')
 
     sensor_type: Adafruit_DHT.DHT11
     pin: int
-    last_read: Optional[Dict[str, float]] = None
+    last_read: Optional[Dict[str, float]]
+    last_read_time: float
+    last_attempt_time: float
+    max_age: float
+    read_lock: threading.Lock
+    poll_interval: Optional[float]
+    snapshot: Optional[Tuple[float, float, float]]
+    poll_thread: Optional[threading.Thread]
+    pigpio_reader: Optional[PigpioDHT11Reader]
+    poll_stop_event: threading.Event
     logger: logging.Logger
 
-    def __new__(cls: Type['DHT11Sensor'], pin: int, sensor_type: Adafruit_DHT.DHT11 = Adafruit_DHT.DHT11) -> 'DHT11Sensor':
+    def __new__(cls: Type['DHT11Sensor'], pin: int, sensor_type: Adafruit_DHT.DHT11 = Adafruit_DHT.DHT11, max_age: float = DHT11_MAX_AGE, poll_interval: Optional[float] = None) -> 'DHT11Sensor':
         """
-        Ensures that only one instance of DHTSensorSingleton per GPIO pin is created. If an instance for a given pin already exists, it returns that instance; otherwise, it creates a new one.
+        Ensures that only one instance of DHT11Sensor per GPIO pin is created. If an instance for a given pin already exists, it returns that instance without taking the class lock; otherwise, it creates a new one under the lock.
 
         Args:
             pin (int): The GPIO pin number where the sensor is connected.
             sensor_type (Adafruit_DHT.DHT11, optional): The type of DHT sensor.
+            max_age (float, optional): Time in seconds a successful read is reused. Only used when the instance is first created.
+            poll_interval (Optional[float], optional): Interval of the background polling thread. Only used when the instance is first created.
 
         Returns:
-            DHT11: An instance of the DHTSensorSingleton class for the specified GPIO pin.
+            DHT11Sensor: An instance of the DHT11Sensor class for the specified GPIO pin.
         """
+        instance = cls._instances.get(pin)
+        if instance is not None:
+            return instance
         with cls._lock:
             if pin not in cls._instances:
                 instance = super(DHT11Sensor, cls).__new__(cls)
                 instance.sensor_type = sensor_type
                 instance.pin = pin
                 instance.last_read = None
+                instance.last_read_time = 0.0
+                instance.last_attempt_time = -max_age
+                instance.max_age = max_age
+                instance.read_lock = threading.Lock()
+                instance.poll_interval = poll_interval
+                instance.snapshot = None
+                instance.poll_thread = None
+                instance.poll_stop_event = threading.Event()
                 instance.logger = logging.getLogger('app_logger')
-                instance._initialize_gpio(pin)
+                instance.pigpio_reader = PigpioDHT11Reader.create(pin) if sensor_type == Adafruit_DHT.DHT11 else None
+                if instance.pigpio_reader is None:
+                    instance._initialize_gpio(pin)
+                else:
+                    instance.logger.info("GPIO pin %s has been set up for DHT sensor using the pigpio daemon.", pin)
+                if poll_interval:
+                    instance.start_polling()
                 cls._instances[pin] = instance
             return cls._instances[pin]
 
     def _initialize_gpio(self, pin: int) -> None:
         """
-        Initializes the GPIO settings for the specified pin. This method sets the GPIO mode and prepares the pin for input.
+        Initializes the GPIO settings for the specified pin. This method makes sure the GPIO mode is configured and prepares the pin for input.
 
         Args:
             pin (int): The GPIO pin number to initialize.
         """
         try:
-            GPIO.setmode(GPIO.BCM)
-            GPIO.setwarnings(False)
+            GPIOManager.ensure_mode()
             GPIO.setup(pin, GPIO.IN)
-            self.logger.info(f"GPIO pin {pin} has been set up for DHT sensor.")
+            GPIOManager.claim(pin)
+            self.logger.info("GPIO pin %s has been set up for DHT sensor.", pin)
         except Exception as ex:
             self.logger.error(f"Failed to initialize GPIO pin {pin} for DHT sensor: {ex}")
             raise
 
-    def read_sensor_value(self) -> Optional[Dict[str, float]]:
+    def read_sensor_value(self, force_refresh: bool = False) -> Optional[Dict[str, float]]:
         """
         Performs a read operation on the DHT sensor to get the current humidity and temperature values.
+        A successful read younger than max_age is returned without reading the sensor again, so the temperature and humidity sensors sharing the pin cause one blocking read between them.
+        The sensor cannot deliver a new measurement sooner than its sampling period, so if the last read failed less than max_age ago, None is returned right away instead of blocking on another read.
+        When the polling thread is running, the latest snapshot is returned instead, or None if it is older than DHT11_SNAPSHOT_MAX_POLLS poll intervals.
+
+        Args:
+            force_refresh (bool): Read the sensor even if the last successful read is still fresh. Defaults to False.
 
         Returns:
             dict: A dictionary containing the current humidity and temperature readings, or None if the read fails.
         """
+        if self.poll_thread is not None and not force_refresh:
+            snapshot = self.snapshot
+            if snapshot is None or time.monotonic() - snapshot[2] > self.poll_interval * DHT11_SNAPSHOT_MAX_POLLS:
+                return None
+            return {'humidity': snapshot[0], 'temperature': snapshot[1]}
+        with self.read_lock:
+            if not force_refresh:
+                now = time.monotonic()
+                if self.last_read is not None and now - self.last_read_time < self.max_age:
+                    return self.last_read
+                if now - self.last_attempt_time < self.max_age:
+                    self.logger.debug("DHT11 on PIN: %s last read failed less than %s s ago, not reading again yet", self.pin, self.max_age)
+                    return None
+            return self._read_from_sensor()
+
+    def _read_from_sensor(self) -> Optional[Dict[str, float]]:
+        """
+        Reads the sensor and stores a successful result in last_read, recording the end of the read in last_attempt_time. Must be called with read_lock held.
+        The sensor is read through the pigpio daemon when it is available, or with Adafruit_DHT otherwise. Single-shot reads are made up to DHT11_READ_ATTEMPTS times with a delay starting at DHT11_RETRY_DELAY and doubling after each failed attempt, instead of Adafruit_DHT.read_retry which waits 2 seconds between its up to 15 attempts.
+
+        Returns:
+            dict: A dictionary containing the humidity and temperature readings, or None if all attempts failed.
+        """
         try:
-            humidity, temperature = Adafruit_DHT.read_retry(self.sensor_type, self.pin)
-            self.last_read = {'humidity': humidity, 'temperature': temperature}
-            self.logger.info(f"DHT11 on PIN: {self.pin} read {self.last_read}")
-            return self.last_read
+            delay = DHT11_RETRY_DELAY
+            for attempt in range(DHT11_READ_ATTEMPTS):
+                if self.pigpio_reader is not None:
+                    humidity, temperature = self.pigpio_reader.read()
+                else:
+                    humidity, temperature = Adafruit_DHT.read(self.sensor_type, self.pin)
+                if humidity is not None and temperature is not None:
+                    self.last_read = {'humidity': humidity, 'temperature': temperature}
+                    self.last_read_time = time.monotonic()
+                    self.logger.info("DHT11 on PIN: %s read %s", self.pin, self.last_read)
+                    return self.last_read
+                if attempt < DHT11_READ_ATTEMPTS - 1:
+                    time.sleep(delay)
+                    delay *= 2
+            self.logger.warning("DHT11 on PIN: %s failed to read after %s attempts", self.pin, DHT11_READ_ATTEMPTS)
+            return None
         except Exception as ex:
             self.logger.error(f"Error reading DHT sensor on pin {self.pin}: {ex}")
             return None
+        finally:
+            self.last_attempt_time = time.monotonic()
+
+    def start_polling(self) -> None:
+        """
+        Starts the background thread that reads the sensor every poll_interval seconds. If the thread is already running, this method does nothing.
+        """
+        if self.poll_thread is None and self.poll_interval:
+            self.poll_stop_event.clear()
+            self.poll_thread = threading.Thread(target=self._poll_loop, daemon=True)
+            self.poll_thread.start()
+            self.logger.info("DHT11 on PIN: %s polling every %s s started.", self.pin, self.poll_interval)
+
+    def stop_polling(self) -> None:
+        """
+        Stops the background polling thread and waits for it to finish. Later reads go to the sensor on demand.
+        """
+        thread = self.poll_thread
+        if thread is not None:
+            self.poll_stop_event.set()
+            thread.join()
+            self.poll_thread = None
+            self.logger.info("DHT11 on PIN: %s polling stopped.", self.pin)
+
+    def _poll_loop(self) -> None:
+        """
+        Reads the sensor until stopped and publishes each successful read as a new snapshot tuple.
+        """
+        while not self.poll_stop_event.is_set():
+            with self.read_lock:
+                data = self._read_from_sensor()
+            if data is not None:
+                self.snapshot = (data['humidity'], data['temperature'], time.monotonic())
+            self.poll_stop_event.wait(self.poll_interval)
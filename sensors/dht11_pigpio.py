@@ -0,0 +1,109 @@
+import logging
+import threading
+import time
+from typing import List, Optional, Tuple
+try:
+    import pigpio
+except ImportError:
+    pigpio = None
+
+START_PULSE_TIME = 0.018
+READ_TIMEOUT = 0.05
+DATA_BITS = 40
+MAX_HIGH_PULSE_US = 200
+ONE_BIT_THRESHOLD_US = 50
+
+class PigpioDHT11Reader:
+    """
+    Reads a DHT11 sensor through the pigpio daemon. The edges of the data line are timestamped by the daemon, so the bits are decoded from microsecond-accurate pulse widths instead of being bit-banged from Python or a busy-waiting C extension.
+
+    Attributes:
+        pi (pigpio.pi): Connection to the pigpio daemon.
+        pin (int): The GPIO pin number that the sensor is connected to.
+        logger (logging.Logger): Logger instance for logging sensor operation messages.
+        high_pulses (List[int]): Widths in microseconds of the high pulses seen during the current read.
+        last_rising_tick (Optional[int]): Daemon tick of the last rising edge, None before the first one.
+        done (threading.Event): Event set once all pulses of a transmission were seen.
+    """
+    def __init__(self, pi: 'pigpio.pi', pin: int) -> None:
+        self.pi = pi
+        self.pin = pin
+        self.logger: logging.Logger = logging.getLogger('app_logger')
+        self.high_pulses: List[int] = []
+        self.last_rising_tick: Optional[int] = None
+        self.done: threading.Event = threading.Event()
+        self.pi.set_mode(pin, pigpio.INPUT)
+
+    @classmethod
+    def create(cls, pin: int) -> Optional['PigpioDHT11Reader']:
+        """
+        Creates a reader for the given pin if the pigpio module is installed and the pigpio daemon is running.
+
+        Args:
+            pin (int): The GPIO pin number that the sensor is connected to.
+
+        Returns:
+            Optional[PigpioDHT11Reader]: The reader, or None if pigpio is not available.
+        """
+        if pigpio is None:
+            return None
+        try:
+            pi = pigpio.pi()
+            if not pi.connected:
+                return None
+            return cls(pi, pin)
+        except Exception as ex:
+            logging.getLogger('app_logger').error(f"Failed to connect to pigpio daemon for DHT sensor on pin {pin}: {ex}")
+            return None
+
+    def _edge_callback(self, gpio: int, level: int, tick: int) -> None:
+        """
+        Records the width of each high pulse when the line falls. Long pulses, such as the idle level before the start signal, are ignored.
+
+        Args:
+            gpio (int): The GPIO pin number.
+            level (int): The new level of the line.
+            tick (int): Daemon timestamp of the edge in microseconds.
+        """
+        if level == 1:
+            self.last_rising_tick = tick
+        elif level == 0 and self.last_rising_tick is not None:
+            width = pigpio.tickDiff(self.last_rising_tick, tick)
+            if width < MAX_HIGH_PULSE_US:
+                self.high_pulses.append(width)
+                if len(self.high_pulses) >= DATA_BITS + 2:
+                    self.done.set()
+
+    def read(self) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Triggers one transmission of the sensor and decodes it. The 40 data bits are the last 40 high pulses, a pulse longer than ONE_BIT_THRESHOLD_US being a one.
+
+        Returns:
+            Tuple[Optional[float], Optional[float]]: The humidity and temperature, or (None, None) if the transmission was incomplete or failed the checksum.
+        """
+        self.high_pulses = []
+        self.last_rising_tick = None
+        self.done.clear()
+        callback = self.pi.callback(self.pin, pigpio.EITHER_EDGE, self._edge_callback)
+        try:
+            self.pi.write(self.pin, 0)
+            time.sleep(START_PULSE_TIME)
+            self.pi.set_mode(self.pin, pigpio.INPUT)
+            self.done.wait(READ_TIMEOUT)
+        finally:
+            callback.cancel()
+        pulses = self.high_pulses
+        if len(pulses) < DATA_BITS:
+            self.logger.debug("DHT11 on PIN: %s incomplete transmission, %s bits received", self.pin, len(pulses))
+            return None, None
+        data = bytearray(5)
+        for index, width in enumerate(pulses[-DATA_BITS:]):
+            data[index // 8] = (data[index // 8] << 1) | (width > ONE_BIT_THRESHOLD_US)
+        if (data[0] + data[1] + data[2] + data[3]) & 0xFF != data[4]:
+            self.logger.debug("DHT11 on PIN: %s checksum mismatch for %s", self.pin, bytes(data))
+            return None, None
+        humidity = data[0] + data[1] / 10
+        temperature = data[2] + (data[3] & 0x7F) / 10
+        if data[3] & 0x80:
+            temperature = -temperature
+        return humidity, temperature
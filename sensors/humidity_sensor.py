@@ -1,8 +1,6 @@
-import time
 from typing import Optional
 from sensors.DHT11 import DHT11Sensor
-from sensors.sensor import BaseSensor
-import logging
+from sensors.sensor import BaseSensor, NAN
 
 class HumiditySensor(BaseSensor):
     """
@@ -12,71 +10,69 @@ class HumiditySensor(BaseSensor):
         pin (int): GPIO pin number where the DHT11 sensor is connected.
         min_value (float): Minimum acceptable humidity value for anomaly detection.
         max_value (float): Maximum acceptable humidity value for anomaly detection.
+        poll_interval (Optional[float]): Interval in seconds at which the DHT11 is read in the background, None to read it on demand.
         logger (logging.Logger): Logger for recording operational messages.
 
     Methods:
         configure_sensor: Initializes the DHT11 sensor.
         read_sensor: Attempts to read the humidity from the sensor, with anomaly detection and range validation.
     """
-    def __init__(self, pin: int, min_value: float = 20.0, max_value: float = 90.0, *args, **kwargs) -> None:
+    __slots__ = ('pin', 'dht_sensor', 'min_value', 'max_value', 'poll_interval')
+
+    def __init__(self, pin: int, min_value: float = 20.0, max_value: float = 90.0, poll_interval: Optional[float] = None, *args, **kwargs) -> None:
         self.pin: int = pin
         self.dht_sensor: Optional[DHT11Sensor] = None
         self.min_value: float = min_value
         self.max_value: float = max_value
-        self.logger: logging.Logger = logging.getLogger('app_logger')
+        self.poll_interval: Optional[float] = poll_interval
         super().__init__(*args, **kwargs)
 
     def configure_sensor(self) -> None:
         """
-        Initializes the DHT11 sensor with the specified GPIO pin.
+        Initializes the DHT11 sensor with the specified GPIO pin, polling it in the background if poll_interval is set. The DHT11 is shared by the sensors on the same pin and the first one configured decides how it is read.
         """
         try:
-            self.dht_sensor = DHT11Sensor(self.pin)
-            self.logger.info(f"Humidity sensor name={self.name} on pin {self.pin} configured.")
+            self.dht_sensor = DHT11Sensor(self.pin, poll_interval=self.poll_interval)
+            self.logger.info("Humidity sensor name=%s on pin %s configured.", self.name, self.pin)
         except Exception as ex:
             self.logger.error(f"Failed to configure humidity sensor name={self.name} on pin {self.pin}: {ex}")
 
     def read_sensor(self) -> float:
         """
-        Attempts to read the humidity from the DHT11 sensor up to three times. Validates the humidity reading to ensure it's within specified range and not an anomaly if anomaly detection is enabled.
+        Reads the humidity from the DHT11 sensor, which retries failed reads itself. Validates the humidity reading to ensure it's within specified range and not an anomaly if anomaly detection is enabled.
 
         Returns:
             float: The humidity reading or NaN if the reading fails validation checks or cannot be read.
         """
         try:
-            for _ in range(3):
-                sensor_data = self.dht_sensor.read_sensor_value()
-                if sensor_data is not None:
-                    self.logger.info(f"Humidity sensor name={self.name} read from pin {self.pin}: {sensor_data['humidity']}%")
-                    humidity = self.to_float(sensor_data['humidity'])
-
-                    if not self.is_number(humidity):
-                        self.logger.warning(f"Sensor name={self.name} read value is not a number: {humidity}. Returning NaN.")
-                        return float('nan')
-
-                    if not self.is_in_range(humidity, self.min_value, self.max_value):
-                        self.logger.warning(
-                            f"Sensor name={self.name} read value={humidity} is outside the acceptable range [{self.min_value}, {self.max_value}]. Returning NaN.")
-                        return float('nan')
+            sensor_data = self.dht_sensor.read_sensor_value()
+            if sensor_data is None:
+                self.logger.warning("Failed to read humidity sensor name=%s from pin %s.", self.name, self.pin)
+                return NAN
+            self.logger.info("Humidity sensor name=%s read from pin %s: %s%%", self.name, self.pin, sensor_data['humidity'])
+            humidity = self.to_float(sensor_data['humidity'])
 
-                    if self.anomaly_detection:
-                        if self.detect_anomaly(new_value=humidity, acceptable_deviation=3):
-                            self.logger.warning(
-                                f"Sensor name={self.name} anomaly detector return True for humidity={humidity}, return NaN.")
-                            return float('nan')
-                        else:
-                            self.logger.info(f"Sensor name={self.name} - Anomaly not found.")
-                    else:
-                        self.logger.info(f"Sensor name={self.name} - Anomaly detection is disabled")
+            if not self.min_value <= humidity <= self.max_value:
+                if humidity != humidity:
+                    self.logger.warning("Sensor name=%s read value is not a number: %s. Returning NaN.", self.name, humidity)
+                else:
+                    self.logger.warning(
+                        "Sensor name=%s read value=%s is outside the acceptable range [%s, %s]. Returning NaN.", self.name, humidity, self.min_value, self.max_value)
+                return NAN
 
-                    self.logger.info(
-                        f"Sensor name={self.name} humidity read from pin {self.pin}: {humidity}%. Anomaly detection: {'enabled' if self.anomaly_detection else 'disabled'}")
-                    return humidity
+            if self.anomaly_detection:
+                if self.detect_anomaly(new_value=humidity, acceptable_deviation=3):
+                    self.logger.warning(
+                        "Sensor name=%s anomaly detector return True for humidity=%s, return NaN.", self.name, humidity)
+                    return NAN
                 else:
-                    self.logger.warning(f"Failed to read humidity sensor name={self.name} from pin {self.pin}.")
-                    time.sleep(0.5)
-            self.logger.warning(f"Cannot read humidity sensor name={self.name} from pin {self.pin} - return NaN.")
-            return float('nan')
+                    self.logger.info("Sensor name=%s - Anomaly not found.", self.name)
+            else:
+                self.logger.info("Sensor name=%s - Anomaly detection is disabled", self.name)
+
+            self.logger.info(
+                "Sensor name=%s humidity read from pin %s: %s%%. Anomaly detection: %s", self.name, self.pin, humidity, 'enabled' if self.anomaly_detection else 'disabled')
+            return humidity
         except Exception as ex:
             self.logger.error(f"Error reading humidity sensor name={self.name} on pin {self.pin}: {ex}")
-            return float('nan')
+            return NAN
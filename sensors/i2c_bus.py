@@ -0,0 +1,20 @@
+import threading
+from typing import Optional
+import board
+import busio
+
+_bus: Optional[busio.I2C] = None
+_bus_lock: threading.Lock = threading.Lock()
+
+def get_i2c_bus() -> busio.I2C:
+    """
+    Returns the I2C bus shared by all I2C sensors, opening it on first use. Sensors on the same bus then use one bus object, whose lock keeps their transactions from interleaving, instead of each opening the bus device separately.
+
+    Returns:
+        busio.I2C: The shared I2C bus.
+    """
+    global _bus
+    with _bus_lock:
+        if _bus is None:
+            _bus = busio.I2C(board.SCL, board.SDA)
+        return _bus
@@ -1,8 +1,7 @@
 import time
 from typing import Optional
 from sensors.BH1750FVI import BH1750Sensor
-from sensors.sensor import BaseSensor
-import logging
+from sensors.sensor import BaseSensor, NAN
 
 class LightSensor(BaseSensor):
     """
@@ -19,14 +18,14 @@ class LightSensor(BaseSensor):
         configure_sensor: Initializes the BH1750 sensor.
         read_sensor: Attempts to read the light intensity from the sensor, with anomaly detection and range validation.
     """
+    __slots__ = ('i2c_address', 'bh1750_sensor', 'min_value', 'max_value')
+
     def __init__(self, i2c_address: int = 0x23, min_value: float = 0.0, max_value: float = 65535.0, *args, **kwargs) -> None:
         self.i2c_address: int = i2c_address
         self.bh1750_sensor: Optional[BH1750Sensor] = None
         self.min_value: float = min_value
         self.max_value: float = max_value
-        self.logger: logging.Logger = logging.getLogger('app_logger')
         super().__init__(*args, **kwargs)
-        self.configure_sensor()
 
     def configure_sensor(self) -> None:
         """
@@ -34,7 +33,7 @@ class LightSensor(BaseSensor):
         """
         try:
             self.bh1750_sensor = BH1750Sensor(self.i2c_address)
-            self.logger.info(f"Light sensor name={self.name} on I2C address {self.i2c_address} configured.")
+            self.logger.info("Light sensor name=%s on I2C address %s configured.", self.name, self.i2c_address)
         except Exception as ex:
             self.logger.error(f"Failed to configure light sensor name={self.name} on I2C address {self.i2c_address}: {ex}")
 
@@ -48,29 +47,29 @@ class LightSensor(BaseSensor):
         try:
             light_intensity = self.bh1750_sensor.read_sensor_value()
             if light_intensity is not None:
-                self.logger.info(f"Sensor name={self.name} light intensity read from I2C address {self.i2c_address}: {light_intensity} lux")
+                self.logger.info("Sensor name=%s light intensity read from I2C address %s: %s lux", self.name, self.i2c_address, light_intensity)
 
                 if not self.is_number(light_intensity):
-                    self.logger.warning(f"Sensor name={self.name} read value is not a number: {light_intensity}. Returning NaN.")
-                    return float('nan')
+                    self.logger.warning("Sensor name=%s read value is not a number: %s. Returning NaN.", self.name, light_intensity)
+                    return NAN
 
-                if not self.is_in_range(light_intensity, self.min_value, self.max_value):
+                if not self.min_value <= light_intensity <= self.max_value:
                     self.logger.warning(
-                        f"Sensor name={self.name} read value={light_intensity} lux is outside the acceptable range [{self.min_value}, {self.max_value} lux]. Returning NaN.")
-                    return float('nan')
+                        "Sensor name=%s read value=%s lux is outside the acceptable range [%s, %s lux]. Returning NaN.", self.name, light_intensity, self.min_value, self.max_value)
+                    return NAN
 
                 if self.anomaly_detection:
                     if self.detect_anomaly(new_value=light_intensity, acceptable_deviation=10):
                         self.logger.warning(
-                            f"Sensor name={self.name} - Anomaly detected for light intensity={light_intensity} lux, returning NaN.")
-                        return float('nan')
+                            "Sensor name=%s - Anomaly detected for light intensity=%s lux, returning NaN.", self.name, light_intensity)
+                        return NAN
                     else:
-                        self.logger.info(f"Sensor name={self.name} - Anomaly not found.")
+                        self.logger.info("Sensor name=%s - Anomaly not found.", self.name)
 
                 return light_intensity
             else:
-                self.logger.warning(f"Failed to read light intensity sensor name={self.name} from I2C address {self.i2c_address}.")
-                return float('nan')
+                self.logger.warning("Failed to read light intensity sensor name=%s from I2C address %s.", self.name, self.i2c_address)
+                return NAN
         except Exception as ex:
             self.logger.error(f"Error reading light sensor name={self.name} on I2C address {self.i2c_address}: {ex}")
-            return float('nan')
+            return NAN
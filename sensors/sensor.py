@@ -2,14 +2,23 @@ import logging
 import math
 import threading
 import time
-from collections import deque
 from abc import ABC, abstractmethod
+from typing import Callable, List, Optional
 import datetime
 import numpy as np
 from databases.influx import InfluxDBManager
+from sensors.sensor_scheduler import SensorScheduler
+
+NAN = float('nan')
+READ_INTERVAL_BACKOFF = 1.5
+READ_INTERVAL_MAX_FACTOR = 4
+NANOSECONDS_PER_SECOND = 1_000_000_000
+MAD_TO_STANDARD_DEVIATION = 1.4826
 
 class BaseSensor(ABC):
-    def __init__(self, name: str, read_frequency: int = 60, max_readings: int = 100, start_immediately: bool = False, anomaly_detection: bool = True):
+    __slots__ = ('logger', 'name', 'read_frequency', 'anomaly_detection', 'max_readings', 'values', 'timestamps', 'monotonic_timestamps', 'head', 'size', 'readings_lock', 'listeners', 'noise_floor', 'max_read_interval', 'read_interval', 'last_value', 'influx_manager')
+
+    def __init__(self, name: str, read_frequency: int = 60, max_readings: int = 100, start_immediately: bool = False, anomaly_detection: bool = True, noise_floor: Optional[float] = None, max_read_interval: Optional[float] = None):
         """
         Abstract base class for sensors, providing a framework for reading sensor data at a regular interval, storing a fixed number of recent readings, and allowing for immediate or delayed start of data collection.
 
@@ -19,23 +28,43 @@ class BaseSensor(ABC):
             name (str): Stores the name senosra.
             anomaly_detection (bool): Flag indicating whether anomaly detection is enabled.
             max_readings (int): Maximum number of recent sensor readings to store.
-            readings (collections.deque): A deque object storing the latest sensor readings along with their timestamps.
-            read_thread (threading.Thread | None): The thread object that runs the sensor reading loop. None if not started.
-            running (bool): Flag indicating whether the sensor reading loop is currently running.
+            values (np.ndarray): Ring buffer of the last max_readings reading values. Like the other ring buffers it has room for twice max_readings entries and every entry is also written max_readings slots further, so the stored readings are always one contiguous slice.
+            timestamps (np.ndarray): Ring buffer of the Unix timestamps of the readings, parallel to values.
+            monotonic_timestamps (np.ndarray): Ring buffer of the time.monotonic_ns() values of the readings as int64 nanoseconds, parallel to values. Used for the age of readings, which is not affected by changes of the system clock.
+            head (int): Index of the slot the next reading is written to, which is the oldest reading once the buffer is full.
+            size (int): Number of readings stored in the ring buffers.
+            readings_lock (threading.Lock): Lock guarding the ring buffers against reads of a half-written reading.
+            listeners (List[Callable[[BaseSensor, dict], None]]): Callbacks notified with the sensor and the new record after every stored reading.
+            noise_floor (Optional[float]): Change between successive readings below which the value is considered steady. None disables the adaptive read interval.
+            max_read_interval (float): Longest interval in seconds the adaptive read interval backs off to.
+            read_interval (float): Current interval in seconds between readings, equal to read_frequency unless the readings are steady.
+            last_value (Optional[float]): The last valid reading, compared with the next one to adapt the read interval.
+            influx_manager (InfluxDBManager): Shared InfluxDB manager the readings are written to.
 
         Args:
             read_frequency (int, optional): How often to read the sensor in seconds. Defaults to 60.
             max_readings (int, optional): The maximum number of readings to store. Defaults to 100.
             start_immediately (bool, optional): Whether to start reading sensor data immediately upon object creation. Defaults to False.
+            noise_floor (Optional[float], optional): If given, the read interval grows by READ_INTERVAL_BACKOFF after every reading that differs from the previous one by less than this value, and drops back to read_frequency on a larger change. Defaults to None.
+            max_read_interval (Optional[float], optional): Longest adaptive read interval in seconds. Defaults to READ_INTERVAL_MAX_FACTOR times read_frequency.
         """
         self.logger = logging.getLogger('app_logger')
         self.name = name
         self.read_frequency = read_frequency
         self.anomaly_detection: bool = anomaly_detection
         self.max_readings = max_readings
-        self.readings = deque(maxlen=max_readings)
-        self.read_thread = None
-        self.running = False
+        self.values: np.ndarray = np.empty(2 * max_readings)
+        self.timestamps: np.ndarray = np.empty(2 * max_readings)
+        self.monotonic_timestamps: np.ndarray = np.empty(2 * max_readings, dtype=np.int64)
+        self.head: int = 0
+        self.size: int = 0
+        self.readings_lock: threading.Lock = threading.Lock()
+        self.listeners: List[Callable[['BaseSensor', dict], None]] = []
+        self.noise_floor: Optional[float] = noise_floor
+        self.max_read_interval: float = max_read_interval if max_read_interval is not None else read_frequency * READ_INTERVAL_MAX_FACTOR
+        self.read_interval: float = read_frequency
+        self.last_value: Optional[float] = None
+        self.influx_manager: InfluxDBManager = InfluxDBManager()
 
         try:
             self.configure_sensor()
@@ -55,57 +84,112 @@ class BaseSensor(ABC):
 
     def start_reading(self) -> None:
         """
-        Starts the sensor reading loop in a separate thread. If the loop is already running, this method does nothing.
+        Starts taking readings by registering the sensor with the shared SensorScheduler, which calls tick from its single thread. If the sensor is already registered, this method does nothing.
         """
-        if not self.running:
-            self.running = True
-            try:
-                self.read_thread = threading.Thread(target=self._read_sensor_loop, daemon=True)
-                self.read_thread.start()
-                self.logger.info(f"Sensor name={self.name} reading started.")
-            except Exception as ex:
-                self.logger.error(f"Failed to start sensor name={self.name} reading: {ex}")
+        try:
+            if SensorScheduler().register(self):
+                self.logger.info("Sensor name=%s reading started.", self.name)
+        except Exception as ex:
+            self.logger.error(f"Failed to start sensor name={self.name} reading: {ex}")
 
     def stop_reading(self) -> None:
         """
-        Stops the sensor reading loop if it is currently running. Waits for the reading thread to terminate.
+        Stops taking readings by unregistering the sensor from the SensorScheduler. If a reading is being taken, waits until it has finished.
+        This is the explicit cleanup of a started sensor: the scheduler holds a reference to every registered sensor, so a started sensor is never garbage collected before it is stopped.
         """
-        self.running = False
-        if self.read_thread:
-            try:
-                self.read_thread.join()
-                self.read_thread = None
-                self.logger.info("Sensor name={self.name} reading stopped.")
-            except Exception as ex:
-                self.logger.error(f"Error while stopping sensor name={self.name} reading: {ex}")
+        try:
+            if SensorScheduler().unregister(self):
+                self.logger.info("Sensor name=%s reading stopped.", self.name)
+        except Exception as ex:
+            self.logger.error(f"Error while stopping sensor name={self.name} reading: {ex}")
+
+    def tick(self) -> None:
+        """
+        Takes a single reading. Called by the SensorScheduler, which schedules the next call after read_interval. A valid reading is stored with its timestamp in the ring buffers, passed to the listeners and written to InfluxDB.
+        """
+        try:
+            reading = self.read_sensor()
+            if reading is not None and not math.isnan(reading):
+                timestamp = time.time()
+                self.store_reading(timestamp, reading)
+                new_record = self.make_record(timestamp, reading)
+                self.logger.info("Add to readings new value: %s", new_record)
+                self.notify_listeners(new_record)
+                measurement_name = self.__class__.__name__
+                fields = {"value": reading}
+                tags = {"sensor_name": self.name}
+                self.influx_manager.write_data(measurement=measurement_name, fields=fields, tags=tags)
+                self.update_read_interval(reading)
+            else:
+                self.logger.warning(f"Incorrect data for reading={reading}")
+        except Exception as ex:
+            self.logger.error(f"Error during sensor name={self.name} reading: {ex}")
+
+    def store_reading(self, timestamp: float, value: float) -> None:
+        """
+        Writes a reading to the ring buffers, overwriting the oldest one once max_readings readings are stored.
 
-    def _read_sensor_loop(self) -> None:
+        Args:
+            timestamp (float): Unix timestamp of the reading.
+            value (float): The reading value.
+        """
+        with self.readings_lock:
+            head = self.head
+            mirror = head + self.max_readings
+            self.values[head] = self.values[mirror] = value
+            self.timestamps[head] = self.timestamps[mirror] = timestamp
+            self.monotonic_timestamps[head] = self.monotonic_timestamps[mirror] = time.monotonic_ns()
+            self.head = (head + 1) % self.max_readings
+            if self.size < self.max_readings:
+                self.size += 1
+
+    def update_read_interval(self, reading: float) -> None:
+        """
+        Adapts the interval to the next reading when noise_floor is set. While the readings stay within noise_floor of each other the interval backs off up to max_read_interval, and a larger change restores read_frequency.
+
+        Args:
+            reading (float): The new valid reading.
         """
-        The main loop that reads sensor data at the specified frequency until stopped. Each reading is stored with its timestamp and UTC timestamp in the readings deque.
+        if self.noise_floor is None:
+            return
+        if self.last_value is not None and abs(reading - self.last_value) < self.noise_floor:
+            self.read_interval = min(self.read_interval * READ_INTERVAL_BACKOFF, self.max_read_interval)
+        else:
+            self.read_interval = self.read_frequency
+        self.last_value = reading
+
+    def add_listener(self, listener: Callable[['BaseSensor', dict], None]) -> None:
         """
-        influx_manager = InfluxDBManager()
-        while self.running:
+        Registers a callback notified after every new reading is stored.
+
+        Args:
+            listener (Callable[[BaseSensor, dict], None]): Callback receiving the sensor and the new record. It runs on the shared sensor scheduler thread, so it should return quickly.
+        """
+        if listener not in self.listeners:
+            self.listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[['BaseSensor', dict], None]) -> None:
+        """
+        Unregisters a callback added with add_listener.
+
+        Args:
+            listener (Callable[[BaseSensor, dict], None]): The callback to remove.
+        """
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def notify_listeners(self, record: dict) -> None:
+        """
+        Notifies all registered listeners about a new reading. An error in one listener is logged and does not affect the others.
+
+        Args:
+            record (dict): The newly stored reading.
+        """
+        for listener in tuple(self.listeners):
             try:
-                reading = self.read_sensor()
-                if reading is not None and not math.isnan(reading):
-                    new_record = {
-                        "datetime": datetime.datetime.now(),
-                        "utc_timestamp": datetime.datetime.utcnow().timestamp(),
-                        "timestamp": time.time(),
-                        "value": reading
-                    }
-                    self.logger.info(f"Add to readings new value: {new_record}")
-                    self.readings.append(new_record)
-                    measurement_name = self.__class__.__name__
-                    fields = {"value": reading}
-                    tags = {"sensor_name": self.name}
-                    influx_manager.write_data(measurement=measurement_name, fields=fields, tags=tags)
-                else:
-                    self.logger.warning(f"Incorrect data for reading={reading}")
+                listener(self, record)
             except Exception as ex:
-                self.logger.error(f"Error during sensor name={self.name} reading: {ex}")
-            finally:
-                time.sleep(self.read_frequency)
+                self.logger.error(f"Error in listener of sensor name={self.name}: {ex}")
 
     @abstractmethod
     def read_sensor(self) -> float:
@@ -117,6 +201,38 @@ class BaseSensor(ABC):
         """
         pass
 
+    @staticmethod
+    def make_record(timestamp: float, value: float) -> dict:
+        """
+        Builds the dictionary form of a reading handed to listeners and returned by the reading getters. Records are only built on request, the readings themselves are kept in the ring buffers.
+
+        Args:
+            timestamp (float): Unix timestamp of the reading.
+            value (float): The reading value.
+
+        Returns:
+            dict: The reading with its local datetime, UTC timestamp and Unix timestamp. A Unix timestamp is already relative to UTC, so both timestamps hold the same value.
+        """
+        return {
+            "datetime": datetime.datetime.fromtimestamp(timestamp),
+            "utc_timestamp": timestamp,
+            "timestamp": timestamp,
+            "value": value
+        }
+
+    def ordered(self, buffer: np.ndarray) -> np.ndarray:
+        """
+        Returns the contents of one of the ring buffers oldest first. Must be called with readings_lock held. Thanks to the mirrored second half of the buffer the result is always a view, and no copy is made when the buffer has wrapped around.
+
+        Args:
+            buffer (np.ndarray): One of the values, timestamps or monotonic_timestamps ring buffers.
+
+        Returns:
+            np.ndarray: The stored entries of the buffer in the order they were written.
+        """
+        start = (self.head - self.size) % self.max_readings
+        return buffer[start:start + self.size]
+
     def get_latest_reading(self) -> dict:
         """
         Retrieves the most recent sensor reading along with its timestamp.
@@ -124,7 +240,11 @@ class BaseSensor(ABC):
         Returns:
             dict | None: The latest sensor reading and its timestamps, or None if no readings have been taken.
         """
-        return self.readings[-1] if self.readings else None
+        with self.readings_lock:
+            if not self.size:
+                return None
+            index = self.head - 1
+            return self.make_record(float(self.timestamps[index]), float(self.values[index]))
 
     def get_all_readings(self) -> list:
         """
@@ -133,7 +253,24 @@ class BaseSensor(ABC):
         Returns:
             list of dicts: A list of all stored sensor readings with their timestamps.
         """
-        return list(self.readings)
+        with self.readings_lock:
+            values, timestamps = self.ordered(self.values), self.ordered(self.timestamps)
+            return [self.make_record(timestamp, value) for timestamp, value in zip(timestamps.tolist(), values.tolist())]
+
+    def get_readings_since(self, timestamp: float) -> list:
+        """
+        Retrieves the stored sensor readings taken at or after the given time. The readings are stored in time order, so the first matching reading is found by binary search instead of checking every reading.
+
+        Args:
+            timestamp (float): Unix timestamp of the oldest reading to return.
+
+        Returns:
+            list of dicts: The matching readings with their timestamps, oldest first.
+        """
+        with self.readings_lock:
+            values, timestamps = self.ordered(self.values), self.ordered(self.timestamps)
+            start = int(np.searchsorted(timestamps, timestamp, side='left'))
+            return [self.make_record(timestamp, value) for timestamp, value in zip(timestamps[start:].tolist(), values[start:].tolist())]
 
     @staticmethod
     def is_number(value) -> bool:
@@ -205,9 +342,26 @@ class BaseSensor(ABC):
             raise ValueError("Provided value is not a number.")
         return min_value <= value <= max_value
 
+    def recent_values(self, max_history: int, max_age_seconds: float) -> np.ndarray:
+        """
+        Returns the values of at most the latest 'max_history' readings not older than 'max_age_seconds', oldest first.
+        The readings are stored in time order, so the first reading young enough is found by binary search over the monotonic timestamps.
+
+        Args:
+            max_history (int): Maximum number of readings to return.
+            max_age_seconds (float): Maximum age in seconds of the returned readings.
+
+        Returns:
+            np.ndarray: A copy of the matching values.
+        """
+        with self.readings_lock:
+            start = max(int(np.searchsorted(self.ordered(self.monotonic_timestamps), time.monotonic_ns() - int(max_age_seconds * NANOSECONDS_PER_SECOND), side='left')), self.size - max_history)
+            return self.ordered(self.values)[start:].copy()
+
     def detect_anomaly(self, new_value, max_history=10, required_history=3, max_age_seconds=800, acceptable_deviation=3) -> bool:
         """
         Detects anomalies in sensor readings using Z-score calculation. It considers only the latest 'max_history' readings within the 'max_age_seconds' to ensure relevance and gradual changes are not marked as anomalies.
+        The window comes from recent_values, and its mean and standard deviation are computed in one pass with Welford's method.
 
         Args:
             new_value (float): The new sensor value to evaluate.
@@ -220,21 +374,24 @@ class BaseSensor(ABC):
             bool: True if the value is an anomaly, False otherwise.
         """
         try:
-            now = datetime.datetime.now()
-            relevant_readings = [reading['value'] for reading in self.readings
-                                 if now - reading['datetime'] <= datetime.timedelta(seconds=max_age_seconds)]
-
-            if len(relevant_readings) < required_history:
-                self.logger.warning(f"Sensor name={self.name} after time filtering (max_age_seconds={max_age_seconds}), the list has too few elements = {len(relevant_readings)},  required={required_history} - returned False to complete the list.")
+            window = self.recent_values(max_history, max_age_seconds).tolist()
+
+            count = 0
+            mean = 0.0
+            squared_deviations = 0.0
+            for value in window:
+                count += 1
+                delta = value - mean
+                mean += delta / count
+                squared_deviations += delta * (value - mean)
+
+            if count < required_history:
+                self.logger.warning(f"Sensor name={self.name} after time filtering (max_age_seconds={max_age_seconds}), the list has too few elements = {count},  required={required_history} - returned False to complete the list.")
                 return False
 
-            if len(relevant_readings) < max_history:
-                relevant_readings = relevant_readings[-max_history:]
+            standard_deviation = math.sqrt(squared_deviations / count)
 
-            mean = np.mean(relevant_readings)
-            standard_deviation = np.std(relevant_readings)
-
-            self.logger.info(f"Sensor name={self.name} relevant_readings={relevant_readings}, mean={mean}, standard_deviation={standard_deviation}")
+            self.logger.info("Sensor name=%s readings=%s, mean=%s, standard_deviation=%s", self.name, count, mean, standard_deviation)
 
             if standard_deviation == 0:
                 self.logger.warning(f"Sensor name={self.name} the standard_deviation is 0 (all readings are identical), the Z-score cannot be calculated, function returns False.")
@@ -242,11 +399,49 @@ class BaseSensor(ABC):
 
             z_score = (new_value - mean) / standard_deviation
             reply = abs(z_score) > acceptable_deviation
-            self.logger.info(f"Sensor name={self.name} z_score={z_score}, reply={reply}")
+            self.logger.info("Sensor name=%s z_score=%s, reply=%s", self.name, z_score, reply)
             return reply
         except Exception as ex:
             self.logger.error(f"Error on anomaly detector: {ex}")
 
+    def detect_anomaly_hampel(self, new_value: float, max_history: int = 10, required_history: int = 3, max_age_seconds: float = 800, threshold: float = 3.5, fallback_deviation: float = 4) -> bool:
+        """
+        Detects anomalies in sensor readings with a Hampel filter. The new value is an anomaly if it is further from the median of the recent readings than 'threshold' times their median absolute deviation, scaled by MAD_TO_STANDARD_DEVIATION to be comparable with a standard deviation.
+        Unlike the Z-score used by detect_anomaly, the median and the MAD are not pulled towards an outlier that made it into the readings. Only valid readings are stored, so rejected values never enter the window.
+        When most readings are identical, as is common with the coarse resolution of some sensors, the MAD is 0 and the Z-score of detect_anomaly is used instead, with fallback_deviation as its threshold.
+
+        Args:
+            new_value (float): The new sensor value to evaluate.
+            max_history (int): Maximum number of recent readings to consider for anomaly detection.
+            required_history (int): Minimum number of recent readings needed to perform the analysis.
+            max_age_seconds (float): Maximum age in seconds for readings to be considered in the analysis.
+            threshold (float): Number of scaled median absolute deviations from the median above which the value is an anomaly.
+            fallback_deviation (float): Z-score above which the value is an anomaly when the median absolute deviation is 0.
+
+        Returns:
+            bool: True if the value is an anomaly, False otherwise.
+        """
+        try:
+            window = self.recent_values(max_history, max_age_seconds)
+            if window.size < required_history:
+                self.logger.warning("Sensor name=%s has %s readings younger than %s s, required=%s - returned False to complete the list.", self.name, window.size, max_age_seconds, required_history)
+                return False
+
+            median = float(np.median(window))
+            median_absolute_deviation = float(np.median(np.abs(window - median)))
+            self.logger.info("Sensor name=%s readings=%s, median=%s, median_absolute_deviation=%s", self.name, window.size, median, median_absolute_deviation)
+
+            if median_absolute_deviation == 0:
+                self.logger.info("Sensor name=%s the median absolute deviation is 0 (most readings are identical), falling back to the Z-score.", self.name)
+                return self.detect_anomaly(new_value, max_history, required_history, max_age_seconds, fallback_deviation)
+
+            reply = abs(new_value - median) > threshold * MAD_TO_STANDARD_DEVIATION * median_absolute_deviation
+            self.logger.info("Sensor name=%s deviation from median=%s, reply=%s", self.name, new_value - median, reply)
+            return reply
+        except Exception as ex:
+            self.logger.error(f"Error on Hampel anomaly detector: {ex}")
+            return False
+
     def get_read_frequency(self):
         return self.read_frequency
 
@@ -255,10 +450,3 @@ class BaseSensor(ABC):
 
     def set_anomaly_detection(self, anomaly_detection_state: bool = True):
         self.anomaly_detection = anomaly_detection_state
-
-    def __del__(self):
-        """
-        Destructor method that ensures the sensor reading loop is stopped before the object is deleted.
-        """
-        self.logger.info(f"Destroying name={self.name} instance.")
-        self.stop_reading()
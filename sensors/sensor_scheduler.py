@@ -0,0 +1,131 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sensors.sensor import BaseSensor
+
+class SensorScheduler:
+    """
+    SensorScheduler takes the readings of all started sensors from a single thread.
+    Registered sensors are kept in a heap ordered by the monotonic deadline of their next reading. The scheduler thread sleeps until the nearest deadline, takes the reading of the sensor that is due and schedules it again after the sensor's current read interval.
+    Implements a singleton pattern so that all sensors share the same thread.
+
+    Attributes:
+        logger (logging.Logger): Logger instance for logging messages.
+        queue (List[Tuple[float, int, BaseSensor]]): Heap of pending readings as (deadline, sequence number, sensor) tuples.
+        sensors (Dict[BaseSensor, int]): Registered sensors, mapped to the sequence number of their pending heap entry.
+        counter (itertools.count): Source of sequence numbers breaking ties between equal deadlines.
+        condition (threading.Condition): Condition used to guard the heap and wake up the scheduler thread.
+        running (Optional[BaseSensor]): The sensor whose reading is currently being taken, None if none is.
+        thread (Optional[threading.Thread]): The scheduler thread, None if not started.
+    """
+    _instance = None
+    _lock: threading.Lock = threading.Lock()
+
+    def __new__(cls):
+        """
+        Ensures a single instance of the SensorScheduler class is created.
+
+        Returns:
+            SensorScheduler: The singleton instance of the SensorScheduler class.
+        """
+        with cls._lock:
+            if cls._instance is None:
+                instance = super(SensorScheduler, cls).__new__(cls)
+                instance.logger = logging.getLogger('app_logger')
+                instance.queue = []
+                instance.sensors = {}
+                instance.counter = itertools.count()
+                instance.condition = threading.Condition()
+                instance.running = None
+                instance.thread = None
+                cls._instance = instance
+            return cls._instance
+
+    def register(self, sensor: 'BaseSensor') -> bool:
+        """
+        Adds a sensor to the scheduler. Its first reading is taken right away.
+
+        Args:
+            sensor (BaseSensor): The sensor to read.
+
+        Returns:
+            bool: True if the sensor was registered, False if it already was.
+        """
+        with self.condition:
+            if sensor in self.sensors:
+                return False
+            self._push(sensor, 0)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, daemon=True)
+                self.thread.start()
+                self.logger.info("Sensor scheduler started.")
+            self.condition.notify()
+        return True
+
+    def unregister(self, sensor: 'BaseSensor') -> bool:
+        """
+        Removes a sensor from the scheduler. If its reading is being taken, waits until it has finished, so the sensor is not touched by the scheduler after this returns.
+
+        Args:
+            sensor (BaseSensor): The sensor to remove.
+
+        Returns:
+            bool: True if the sensor was registered, False otherwise.
+        """
+        with self.condition:
+            if sensor not in self.sensors:
+                return False
+            del self.sensors[sensor]
+            if threading.current_thread() is not self.thread:
+                while self.running is sensor:
+                    self.condition.wait()
+        return True
+
+    def _push(self, sensor: 'BaseSensor', delay: float) -> None:
+        """
+        Adds the next reading of a sensor to the heap and records it as the sensor's pending entry. Must be called with the condition held.
+
+        Args:
+            sensor (BaseSensor): The sensor to read.
+            delay (float): Delay in seconds after which the reading is taken.
+        """
+        sequence = next(self.counter)
+        self.sensors[sensor] = sequence
+        heapq.heappush(self.queue, (time.monotonic() + delay, sequence, sensor))
+
+    def _run(self) -> None:
+        """
+        The scheduler loop that waits until the nearest deadline and takes the reading of the sensor that is due.
+        Entries left in the heap by unregistered sensors are dropped when they come up.
+        """
+        while True:
+            with self.condition:
+                while True:
+                    if not self.queue:
+                        self.condition.wait()
+                        continue
+                    deadline, sequence, sensor = self.queue[0]
+                    if self.sensors.get(sensor) != sequence:
+                        heapq.heappop(self.queue)
+                        continue
+                    remaining = deadline - time.monotonic()
+                    if remaining > 0:
+                        self.condition.wait(remaining)
+                        continue
+                    heapq.heappop(self.queue)
+                    break
+                self.running = sensor
+            try:
+                sensor.tick()
+            except Exception as ex:
+                self.logger.error(f"Error during sensor {sensor} reading: {ex}")
+            with self.condition:
+                self.running = None
+                if sensor in self.sensors:
+                    self._push(sensor, sensor.read_interval)
+                self.condition.notify_all()
@@ -1,8 +1,7 @@
 from typing import Optional
 
 from sensors.ADS1115 import ADS1115Converter
-from sensors.sensor import BaseSensor
-import logging
+from sensors.sensor import BaseSensor, NAN
 
 class SoilMoistureSensor(BaseSensor):
     """
@@ -20,15 +19,15 @@ class SoilMoistureSensor(BaseSensor):
         configure_sensor: Initializes the ADS1115 ADC converter.
         read_sensor: Attempts to read the soil moisture level from the sensor, with anomaly detection and range validation.
     """
+    __slots__ = ('i2c_address', 'channel', 'ads1115_converter', 'min_value', 'max_value')
+
     def __init__(self, i2c_address: int = 0x48, channel: int = 0, min_value: float = 0.0, max_value: float = 3.3, *args, **kwargs) -> None:
         self.i2c_address: int = i2c_address
         self.channel: int = channel
         self.ads1115_converter: Optional[ADS1115Converter] = None
         self.min_value: float = min_value
         self.max_value: float = max_value
-        self.logger: logging.Logger = logging.getLogger('app_logger')
         super().__init__(*args, **kwargs)
-        self.configure_sensor()
 
     def configure_sensor(self) -> None:
         """
@@ -36,7 +35,7 @@ class SoilMoistureSensor(BaseSensor):
         """
         try:
             self.ads1115_converter = ADS1115Converter(self.i2c_address, self.channel)
-            self.logger.info(f"Soil moisture sensor name={self.name} on ADS1115 I2C address {self.i2c_address}, channel {self.channel} configured.")
+            self.logger.info("Soil moisture sensor name=%s on ADS1115 I2C address %s, channel %s configured.", self.name, self.i2c_address, self.channel)
         except Exception as ex:
             self.logger.error(f"Failed to configure soil moisture sensor name={self.name} on ADS1115 I2C address {self.i2c_address}, channel {self.channel}: {ex}")
 
@@ -50,38 +49,39 @@ class SoilMoistureSensor(BaseSensor):
         try:
             moisture_value = self.ads1115_converter.read()
             if moisture_value is not None:
-                self.logger.info(f"Soil moisture sensor name={self.name} read from ADS1115 I2C address {self.i2c_address}, channel {self.channel}: {moisture_value} V")
+                self.logger.info("Soil moisture sensor name=%s read from ADS1115 I2C address %s, channel %s: %s V", self.name, self.i2c_address, self.channel, moisture_value)
 
                 if not self.is_number(moisture_value):
                     self.logger.warning(f"Sensor name={self.name}  read value is not a number: {moisture_value}. Returning NaN.")
-                    return float('nan')
+                    return NAN
 
-                if not self.is_in_range(moisture_value, self.min_value, self.max_value):
+                if not self.min_value <= moisture_value <= self.max_value:
                     self.logger.warning(
                         f"Sensor name={self.name} read value={moisture_value} V is outside the acceptable range [{self.min_value}, {self.max_value} V]. Returning NaN.")
-                    return float('nan')
+                    return NAN
 
-                self.logger.info(f"Sensor name={self.name} voltage value before conversion: {moisture_value}")
+                self.logger.info("Sensor name=%s voltage value before conversion: %s", self.name, moisture_value)
                 moisture_percentage_value = self.convert_to_percentage(moisture_value)
 
                 if self.anomaly_detection:
                     if self.detect_anomaly(new_value=moisture_percentage_value, acceptable_deviation=5):
                         self.logger.warning(f"Sensor name={self.name} - Anomaly detected for soil moisture_value={moisture_value} V, moisture_percentage_value={moisture_percentage_value}, returning NaN.")
-                        return float('nan')
+                        return NAN
                     else:
-                        self.logger.info(f"Sensor name={self.name} - Anomaly not found.")
+                        self.logger.info("Sensor name=%s - Anomaly not found.", self.name)
 
                 return moisture_percentage_value
             else:
                 self.logger.warning(f"Failed to read soil moisture sensor name={self.name} from ADS1115 I2C address {self.i2c_address}, channel {self.channel}.")
-                return float('nan')
+                return NAN
         except Exception as ex:
             self.logger.error(f"Error reading soil moisture sensor name={self.name} on ADS1115 I2C address {self.i2c_address}, channel {self.channel}: {ex}")
-            return float('nan')
+            return NAN
 
     def convert_to_percentage(self, value: float, min_value: float = 0.8, max_value: float = 3.3) -> float:
         """
         Converts an analog value to a percentage based on the specified minimum and maximum values, with an inverse relationship between the analog value and the percentage.
+        Values outside the range are clamped to it with plain comparisons.
 
         Args:
             value (float): The raw analog value to convert.
@@ -91,10 +91,12 @@ class SoilMoistureSensor(BaseSensor):
         Returns:
             float: The converted value as a percentage from 0 to 1, with higher percentages
                    representing higher moisture levels (and thus lower voltage levels).
+
+        Raises:
+            ZeroDivisionError: If min_value equals max_value.
         """
-        try:
-            value = max(min(value, max_value), min_value)
-            percentage = 1 - (value - min_value) / (max_value - min_value)
-            return percentage
-        except Exception as ex:
-            self.logger.error(f"Failed to convert to a percentage: {ex}")
+        if value < min_value:
+            value = min_value
+        elif value > max_value:
+            value = max_value
+        return 1 - (value - min_value) / (max_value - min_value)
@@ -0,0 +1,116 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Set, Tuple
+
+class TimerService:
+    """
+    TimerService runs delayed callbacks for the whole application from a single thread.
+    Pending callbacks are kept in a heap ordered by their monotonic deadline and the service thread sleeps until the nearest deadline, instead of every delayed action holding its own sleeping thread.
+    Implements a singleton pattern so that all components share the same timer thread.
+
+    Attributes:
+        logger (logging.Logger): Logger instance for logging messages.
+        timers (List[Tuple[float, int, Callable[[], None]]]): Heap of scheduled callbacks as (deadline, handle, callback) tuples.
+        pending (Set[int]): Handles of callbacks that are scheduled and not cancelled.
+        counter (itertools.count): Source of unique handles, also used to break ties between equal deadlines.
+        condition (threading.Condition): Condition used to guard the heap and wake up the service thread.
+        thread (Optional[threading.Thread]): The service thread, None if not started.
+        executor (ThreadPoolExecutor): Shared pool of worker threads that run the due callbacks, so a blocking callback does not delay the others.
+    """
+    _instance = None
+    _lock: threading.Lock = threading.Lock()
+
+    def __new__(cls):
+        """
+        Ensures a single instance of the TimerService class is created.
+
+        Returns:
+            TimerService: The singleton instance of the TimerService class.
+        """
+        with cls._lock:
+            if cls._instance is None:
+                instance = super(TimerService, cls).__new__(cls)
+                instance.logger = logging.getLogger('app_logger')
+                instance.timers = []
+                instance.pending = set()
+                instance.counter = itertools.count()
+                instance.condition = threading.Condition()
+                instance.thread = None
+                instance.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='timer')
+                cls._instance = instance
+            return cls._instance
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> int:
+        """
+        Schedules a callback to be run after the given delay.
+
+        Args:
+            delay (float): Delay in seconds after which the callback is run.
+            callback (Callable[[], None]): The function to call.
+
+        Returns:
+            int: A handle that can be passed to cancel.
+        """
+        with self.condition:
+            handle = next(self.counter)
+            heapq.heappush(self.timers, (time.monotonic() + delay, handle, callback))
+            self.pending.add(handle)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, daemon=True)
+                self.thread.start()
+                self.logger.info("Timer service started.")
+            self.condition.notify()
+        return handle
+
+    def cancel(self, handle: Optional[int]) -> bool:
+        """
+        Cancels a scheduled callback if it has not been run yet.
+
+        Args:
+            handle (Optional[int]): The handle returned by schedule.
+
+        Returns:
+            bool: True if the callback was cancelled, False if it already ran or was unknown.
+        """
+        with self.condition:
+            if handle in self.pending:
+                self.pending.discard(handle)
+                return True
+            return False
+
+    def _run(self) -> None:
+        """
+        The service loop that waits until the nearest deadline and hands the callbacks that are due over to the worker pool.
+        """
+        while True:
+            with self.condition:
+                while True:
+                    if not self.timers:
+                        self.condition.wait()
+                        continue
+                    deadline, handle, callback = self.timers[0]
+                    remaining = deadline - time.monotonic()
+                    if remaining > 0:
+                        self.condition.wait(remaining)
+                        continue
+                    heapq.heappop(self.timers)
+                    if handle in self.pending:
+                        self.pending.discard(handle)
+                        break
+            self.executor.submit(self._run_callback, callback)
+
+    def _run_callback(self, callback: Callable[[], None]) -> None:
+        """
+        Runs a single scheduled callback on a worker thread and logs any error it raises.
+
+        Args:
+            callback (Callable[[], None]): The function to call.
+        """
+        try:
+            callback()
+        except Exception as ex:
+            self.logger.error(f"Error in scheduled callback {callback}: {ex}")